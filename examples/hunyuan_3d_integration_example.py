@@ -192,7 +192,7 @@ def example_direct_hunyuan_client():
 
     try:
         # Generate 3D from image
-        result = hunyuan_client.generate_3d_from_image(
+        result = hunyuan_client.generate_3d_from_image_sync(
             image_path=image_path,
             task_id="direct_test",
             output_dir="output_3d"
@@ -27,4 +27,11 @@ __all__ = [
     "get_optimal_backend",
     "is_backend_available",
     "get_backend_info"
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    """Lazy access to the deprecated sync LLMNamingService shim."""
+    if name == "LLMNamingService":
+        from .llm_naming_service import LLMNamingService
+        return LLMNamingService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
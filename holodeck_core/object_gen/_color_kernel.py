@@ -0,0 +1,46 @@
+"""Color-class histogram kernel for image naming analysis.
+
+Counts how many pixels of an RGB image fall into each color class of a
+32x32x32 lookup table. Uses a parallel Numba kernel when numba is installed
+and falls back to a NumPy fancy-index + bincount otherwise.
+"""
+
+import numpy as np
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, cache=True)
+    def _classify_hist_jit(arr, lut, n_classes):
+        rows, cols = arr.shape[0], arr.shape[1]
+        # One partial histogram per row avoids racing on shared counters
+        partial = np.zeros((rows, n_classes), np.int64)
+        for y in numba.prange(rows):
+            for x in range(cols):
+                label = lut[arr[y, x, 0] >> 3, arr[y, x, 1] >> 3, arr[y, x, 2] >> 3]
+                partial[y, label] += 1
+        return partial.sum(axis=0)
+
+
+def classify_hist(arr: np.ndarray, lut: np.ndarray, n_classes: int) -> np.ndarray:
+    """Histogram of color classes over an image.
+
+    Args:
+        arr: (H, W, 3) uint8 RGB array
+        lut: (32, 32, 32) uint8 table of class labels indexed by channel >> 3
+        n_classes: Number of color classes
+
+    Returns:
+        int64 array of length n_classes with pixel counts per class
+    """
+    arr = np.ascontiguousarray(arr, dtype=np.uint8)
+    if NUMBA_AVAILABLE:
+        return _classify_hist_jit(arr, lut, n_classes)
+
+    labels = lut[arr[..., 0] >> 3, arr[..., 1] >> 3, arr[..., 2] >> 3]
+    return np.bincount(labels.ravel(), minlength=n_classes).astype(np.int64)
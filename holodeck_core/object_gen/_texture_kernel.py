@@ -0,0 +1,58 @@
+"""Texture size validation kernel for material validation.
+
+Flags missing, non-square and non-power-of-two textures in one pass over
+an array of sizes. Uses a Numba kernel when numba is installed and falls
+back to NumPy masks otherwise.
+"""
+
+import numpy as np
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Issue bits in the returned flags
+MISSING = 1
+NOT_SQUARE = 2
+NOT_POW2 = 4
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _size_flags_jit(sizes, missing):
+        flags = np.zeros(sizes.shape[0], np.uint8)
+        for i in range(sizes.shape[0]):
+            if missing[i]:
+                flags[i] = MISSING
+                continue
+            width = sizes[i, 0]
+            flag = 0
+            if width != sizes[i, 1]:
+                flag |= NOT_SQUARE
+            if width & (width - 1) != 0:
+                flag |= NOT_POW2
+            flags[i] = flag
+        return flags
+
+
+def size_flags(sizes: np.ndarray, missing: np.ndarray) -> np.ndarray:
+    """Issue flags for texture sizes.
+
+    Args:
+        sizes: (N, 2) array of (width, height)
+        missing: (N,) bool array, True where the texture is absent
+
+    Returns:
+        uint8 array of length N with MISSING / NOT_SQUARE / NOT_POW2 bits
+    """
+    sizes = np.ascontiguousarray(sizes, dtype=np.int64).reshape(-1, 2)
+    missing = np.ascontiguousarray(missing, dtype=np.bool_)
+    if NUMBA_AVAILABLE:
+        return _size_flags_jit(sizes, missing)
+
+    width = sizes[:, 0]
+    flags = np.where(width != sizes[:, 1], NOT_SQUARE, 0)
+    flags |= np.where((width & (width - 1)) != 0, NOT_POW2, 0)
+    return np.where(missing, MISSING, flags).astype(np.uint8)
@@ -396,18 +396,8 @@ class AssetGenerator:
                                 )
                             )
                     except Exception as e:
-                        self.logger.info(f"增强版LLM命名服务暂时不可用: {e}，尝试使用旧版服务")
-
-                        # 回退到旧版服务
-                        try:
-                            from .llm_naming_service import LLMNamingService
-                            naming_service = LLMNamingService()
-                            generated_name = naming_service.generate_object_name(
-                                description, object_name, card_path
-                            )
-                        except Exception as fallback_error:
-                            self.logger.info(f"LLM命名服务（包括回退）都不可用: {fallback_error}，使用回退机制")
-                            generated_name = None
+                        self.logger.info(f"LLM命名服务不可用: {e}，使用回退机制")
+                        generated_name = None
 
                     if generated_name:
                         # 清理文件名中的非法字符
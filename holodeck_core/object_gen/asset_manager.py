@@ -200,7 +200,8 @@ class AssetGenerationManager:
                             hunyuan_client = self.backend_selector.get_backend_client("hunyuan")
                             logger.info(f"Using Hunyuan 3D for asset {object_id}")
 
-                            hunyuan_result = hunyuan_client.generate_3d_from_image(
+                            hunyuan_result = await asyncio.to_thread(
+                                hunyuan_client.generate_3d_from_image_sync,
                                 image_path=str(object_card_path),
                                 task_id=object_id,
                                 output_dir=str(temp_dir)
@@ -288,7 +289,8 @@ class AssetGenerationManager:
                 if self.backend_priority == "hunyuan" and self.hunyuan_3d_client:
                     try:
                         logger.info(f"Using Hunyuan 3D (legacy mode) for asset {object_id}")
-                        hunyuan_result = self.hunyuan_3d_client.generate_3d_from_image(
+                        hunyuan_result = await asyncio.to_thread(
+                            self.hunyuan_3d_client.generate_3d_from_image_sync,
                             image_path=str(object_card_path),
                             task_id=object_id,
                             output_dir=str(temp_dir)
@@ -587,6 +589,9 @@ class AssetGenerationManager:
             f"({len(successful_assets)}/{len(objects)} successful, {batch_result.cache_hits} cached)"
         )
 
+        # Release manifest handles so the session directory can be removed
+        self.cache.close()
+
         return batch_result
 
     async def _update_session_progress(self, session_id: str):
@@ -641,4 +646,8 @@ class AssetGenerationManager:
     async def cleanup_cache_if_needed(self):
         """Trigger cache cleanup if size limits exceeded."""
         self.cache._cleanup_cache_if_needed()
-        logger.info("Cache cleanup completed")
\ No newline at end of file
+        logger.info("Cache cleanup completed")
+
+    def close(self) -> None:
+        """Flush the asset cache and close its open manifest files."""
+        self.cache.close()
\ No newline at end of file
@@ -6,6 +6,9 @@ and availability. Reads from .env file and system environment variables.
 
 import os
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
@@ -15,6 +18,32 @@ from .sf3d_client import SF3DClient
 
 logger = logging.getLogger(__name__)
 
+# Backend probes (credential checks, client construction) run off the caller's
+# thread so that building a selector never blocks on a network round-trip.
+_probe_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="backend-probe")
+
+# Seconds to wait for a probe when its result is first needed
+_PROBE_TIMEOUT = 30
+
+_TRUE = frozenset({"true", "1", "yes", "on"})
+_FALSE = frozenset({"false", "0", "no", "off"})
+
+
+def _truthy(value: str) -> bool:
+    """Return True if an env value spells an enabled flag."""
+    return value.strip().lower() in _TRUE
+
+
+def _falsy(value: str) -> bool:
+    """Return True if an env value spells a disabled flag."""
+    return value.strip().lower() in _FALSE
+
+
+@lru_cache(maxsize=8)
+def _parse_backend_priority(value: str) -> tuple:
+    """Split a 3D_BACKEND_PRIORITY value into normalized backend names."""
+    return tuple(backend.strip().lower() for backend in value.split(','))
+
 
 @dataclass
 class BackendConfig:
@@ -39,11 +68,54 @@ class BackendSelector:
             workspace_root: Root workspace directory
         """
         self.workspace_root = Path(workspace_root)
-        self.available_backends = {}
+        self._available_backends: Dict[str, Dict[str, Any]] = {}
+        self._probes: Dict[str, Future] = {}
+        # Probes that already hit _PROBE_TIMEOUT; later lookups only check
+        # whether they have finished instead of blocking again
+        self._slow_probes: set = set()
+        self._probe_lock = threading.Lock()
         self.backend_configs = {}
         self._load_environment_config()
         self._detect_available_backends()
 
+    @property
+    def available_backends(self) -> Dict[str, Dict[str, Any]]:
+        """Available backends, resolving any pending probes on first access."""
+        if self._probes:
+            with self._probe_lock:
+                self._resolve_probes()
+        return self._available_backends
+
+    def _resolve_probes(self):
+        """Collect results of pending backend probes (caller holds _probe_lock).
+
+        A probe is removed only once its result is in, so concurrent callers
+        wait on the lock instead of seeing a half-resolved backend map. Probes
+        that time out stay pending and are checked again on later lookups.
+        """
+        if not self._probes:
+            return
+
+        for name, probe in list(self._probes.items()):
+            if name in self._slow_probes and not probe.done():
+                continue
+            try:
+                backend = probe.result(timeout=_PROBE_TIMEOUT)
+            except FutureTimeoutError:
+                self._slow_probes.add(name)
+                logger.warning(f"⚠️  {name} backend probe still running after {_PROBE_TIMEOUT}s")
+                continue
+            except Exception as e:
+                logger.warning(f"⚠️  {name} backend probe failed: {e}")
+                backend = None
+
+            if backend is not None:
+                self._available_backends[name] = backend
+            del self._probes[name]
+            self._slow_probes.discard(name)
+
+        logger.info(f"Available backends: {list(self._available_backends.keys())}")
+
     def _load_environment_config(self):
         """Load configuration from .env file and environment variables."""
         # Default backend priorities
@@ -98,10 +170,7 @@ class BackendSelector:
 
                                 # ComfyUI availability flag
                                 elif key == 'COMFYUI_AVAILABLE':
-                                    if value.lower() in ['true', '1', 'yes']:
-                                        self.backend_configs["sf3d"].config["available"] = True
-                                    else:
-                                        self.backend_configs["sf3d"].config["available"] = False
+                                    self.backend_configs["sf3d"].config["available"] = _truthy(value)
 
                                 # ComfyUI server address
                                 elif key == 'COMFYUI_SERVER':
@@ -112,20 +181,14 @@ class BackendSelector:
                                     self.backend_configs["sf3d"].config["workflow_template"] = value
 
                                 elif key == '3D_BACKEND_PRIORITY':
-                                    # Set backend priority
-                                    backends = value.split(',')
-                                    for i, backend in enumerate(backends):
-                                        backend = backend.strip().lower()
-                                        if backend in self.backend_configs:
-                                            # Higher priority for earlier in list
-                                            self.backend_configs[backend].priority = 100 - i
+                                    self._apply_backend_priority(value)
 
                                 elif key == 'DISABLE_HUNYUAN_3D':
-                                    if value.lower() in ['true', '1', 'yes']:
+                                    if _truthy(value):
                                         self.backend_configs["hunyuan"].enabled = False
 
                                 elif key == 'DISABLE_SF3D':
-                                    if value.lower() in ['true', '1', 'yes']:
+                                    if _truthy(value):
                                         self.backend_configs["sf3d"].enabled = False
 
                     logger.info(f"Loaded configuration from {env_path}")
@@ -139,16 +202,13 @@ class BackendSelector:
         # Backend priority from environment
         backend_priority = os.getenv('3D_BACKEND_PRIORITY')
         if backend_priority:
-            backends = backend_priority.split(',')
-            for i, backend in enumerate(backends):
-                backend = backend.strip().lower()
-                if backend in self.backend_configs:
-                    self.backend_configs[backend].priority = 100 - i
+            self._apply_backend_priority(backend_priority)
 
         # ComfyUI availability from environment
-        if os.getenv('COMFYUI_AVAILABLE', '').lower() in ['true', '1', 'yes']:
+        comfyui_available = os.getenv('COMFYUI_AVAILABLE', '')
+        if _truthy(comfyui_available):
             self.backend_configs["sf3d"].config["available"] = True
-        elif os.getenv('COMFYUI_AVAILABLE', '').lower() in ['false', '0', 'no']:
+        elif _falsy(comfyui_available):
             self.backend_configs["sf3d"].config["available"] = False
 
         # ComfyUI server address from environment
@@ -162,78 +222,109 @@ class BackendSelector:
             self.backend_configs["sf3d"].config["workflow_template"] = sf3d_workflow
 
         # Disable flags
-        if os.getenv('DISABLE_HUNYUAN_3D', '').lower() in ['true', '1', 'yes']:
+        if _truthy(os.getenv('DISABLE_HUNYUAN_3D', '')):
             self.backend_configs["hunyuan"].enabled = False
 
-        if os.getenv('DISABLE_SF3D', '').lower() in ['true', '1', 'yes']:
+        if _truthy(os.getenv('DISABLE_SF3D', '')):
             self.backend_configs["sf3d"].enabled = False
 
+    def _apply_backend_priority(self, value: str):
+        """Set backend priorities from a comma-separated 3D_BACKEND_PRIORITY value."""
+        for i, backend in enumerate(_parse_backend_priority(value)):
+            if backend in self.backend_configs:
+                # Higher priority for earlier in list
+                self.backend_configs[backend].priority = 100 - i
+
     def _detect_available_backends(self):
-        """Detect which backends are available and working."""
-        logger.info("Detecting available 3D generation backends...")
+        """Start probing which backends are available and working.
 
-        # Test Hunyuan 3D availability
-        if self.backend_configs["hunyuan"].enabled:
-            try:
-                secret_id = os.getenv("HUNYUAN_SECRET_ID") or self.backend_configs["hunyuan"].config.get("secret_id")
-                secret_key = os.getenv("HUNYUAN_SECRET_KEY") or self.backend_configs["hunyuan"].config.get("secret_key")
+        Probes run in parallel in the background; results are collected the
+        first time ``available_backends`` is accessed.
+        """
+        logger.info("Detecting available 3D generation backends...")
 
-                try:
-                    # Use from_env to automatically load .env files
-                    test_client = Hunyuan3DClient.from_env()
-                    if test_client.test_connection():
-                        self.available_backends["hunyuan"] = {
-                            "client": test_client,
-                            "config": self.backend_configs["hunyuan"]
-                        }
-                        logger.info("✅ Hunyuan 3D backend available")
-                    else:
-                        logger.warning("⚠️  Hunyuan 3D credentials invalid")
-                except Exception as e:
-                    logger.info(f"ℹ️  Hunyuan 3D credentials not configured or error: {e}")
+        with self._probe_lock:
+            self._available_backends = {}
+            self._probes = {}
+            self._slow_probes = set()
+            self.__dict__.pop("_optimal_backend", None)
+
+            if self.backend_configs["hunyuan"].enabled:
+                self._probes["hunyuan"] = _probe_executor.submit(self._probe_hunyuan)
+
+            if self.backend_configs["sf3d"].enabled:
+                self._probes["sf3d"] = _probe_executor.submit(self._probe_sf3d)
+
+    def _probe_hunyuan(self) -> Optional[Dict[str, Any]]:
+        """Test Hunyuan 3D availability."""
+        try:
+            # Use from_env to automatically load .env files
+            test_client = Hunyuan3DClient.from_env()
+            if test_client.test_connection():
+                logger.info("✅ Hunyuan 3D backend available")
+                return {
+                    "client": test_client,
+                    "config": self.backend_configs["hunyuan"]
+                }
+            logger.warning("⚠️  Hunyuan 3D credentials invalid")
+        except Exception as e:
+            logger.info(f"ℹ️  Hunyuan 3D credentials not configured or error: {e}")
 
-            except Exception as e:
-                logger.warning(f"⚠️  Hunyuan 3D backend not available: {e}")
+        return None
 
-        # Test SF3D availability
-        if self.backend_configs["sf3d"].enabled:
-            try:
-                # Check if ComfyUI is explicitly marked as available
-                comfyui_available = self.backend_configs["sf3d"].config.get("available")
+    def _probe_sf3d(self) -> Optional[Dict[str, Any]]:
+        """Test SF3D availability."""
+        try:
+            # Check if ComfyUI is explicitly marked as available
+            comfyui_available = self.backend_configs["sf3d"].config.get("available")
 
-                if comfyui_available is False:
-                    logger.info("ℹ️  SF3D backend disabled via COMFYUI_AVAILABLE=false")
-                else:
-                    # Get server address from config
-                    server_address = self.backend_configs["sf3d"].config.get("server_address", "127.0.0.1:8189")
+            if comfyui_available is False:
+                logger.info("ℹ️  SF3D backend disabled via COMFYUI_AVAILABLE=false")
+                return None
 
-                    sf3d_client = SF3DClient(server_address=server_address)
+            # Get server address from config
+            server_address = self.backend_configs["sf3d"].config.get("server_address", "127.0.0.1:8189")
 
-                    # Note: We can't easily test SF3D availability without async context
-                    # So we'll assume it's available and let the generation handle failures
-                    self.available_backends["sf3d"] = {
-                        "client": sf3d_client,
-                        "config": self.backend_configs["sf3d"]
-                    }
+            sf3d_client = SF3DClient(server_address=server_address)
 
-                    if comfyui_available is True:
-                        logger.info(f"✅ SF3D backend available (COMFYUI_AVAILABLE=true, server: {server_address})")
-                    else:
-                        logger.info(f"✅ SF3D backend available (server: {server_address})")
+            # Note: We can't easily test SF3D availability without async context
+            # So we'll assume it's available and let the generation handle failures
+            if comfyui_available is True:
+                logger.info(f"✅ SF3D backend available (COMFYUI_AVAILABLE=true, server: {server_address})")
+            else:
+                logger.info(f"✅ SF3D backend available (server: {server_address})")
 
-            except Exception as e:
-                logger.warning(f"⚠️  SF3D backend not available: {e}")
+            return {
+                "client": sf3d_client,
+                "config": self.backend_configs["sf3d"]
+            }
 
-        logger.info(f"Available backends: {list(self.available_backends.keys())}")
+        except Exception as e:
+            logger.warning(f"⚠️  SF3D backend not available: {e}")
+            return None
 
     def get_optimal_backend(self) -> Optional[str]:
         """Get the optimal backend based on priority and availability."""
-        if not self.available_backends:
+        backends = self.available_backends
+        if self._probes:
+            # A slow probe may still add a backend; don't cache this answer
+            return self._select_optimal_backend(backends)
+        return self._optimal_backend
+
+    @cached_property
+    def _optimal_backend(self) -> Optional[str]:
+        """Highest priority available backend, resolved once per configuration."""
+        return self._select_optimal_backend(self.available_backends)
+
+    @staticmethod
+    def _select_optimal_backend(backends: Dict[str, Dict[str, Any]]) -> Optional[str]:
+        """Highest priority backend among those given."""
+        if not backends:
             return None
 
         # Sort by priority (highest first)
         sorted_backends = sorted(
-            self.available_backends.items(),
+            backends.items(),
             key=lambda x: x[1]["config"].priority,
             reverse=True
         )
@@ -4,18 +4,29 @@ Implements a dual-layer caching system (session + global) to avoid regenerating
 the same 3D assets from identical object cards.
 """
 
-import asyncio
 import hashlib
+import heapq
+import io
 import json
 import logging
+import math
 import os
+import shutil
 import time
-from datetime import datetime, timezone
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Canonical order of the generation parameters used by the object_gen pipeline.
+# Alphabetical, so keys match the previous sorted(params) format.
+_KEY_ORDER = ("foreground_ratio", "texture_resolution", "vertex_count")
+
+# Manifest handles kept open at once; least recently used ones are closed
+# so session manifests don't pin descriptors after the session is gone
+_MAX_OPEN_MANIFESTS = 4
+
 
 class ImageHashCache:
     """Dual-layer cache system (session-level + global-level) for 3D assets."""
@@ -30,6 +41,15 @@ class ImageHashCache:
         self.session_cache: Dict[str, Dict] = {}  # In-memory session cache
         self.global_cache: Dict[str, Dict] = {}   # In-memory global cache
 
+        # Open manifest handles, so repeated reads/writes of the same manifest
+        # reuse one descriptor. LRU-capped at _MAX_OPEN_MANIFESTS.
+        self._fds: "OrderedDict[Path, io.BufferedRandom]" = OrderedDict()
+
+        # Manifest edits found on read paths (stale entries, expired entries).
+        # They are hidden from loads immediately and persisted by the next real
+        # write to the same manifest or by flush().
+        self._stale_pending: Set[Tuple[Path, str]] = set()
+
         # Cache TTL (days)
         self.session_ttl = None  # Lives for session duration
         self.global_ttl_days = int(os.getenv("HOLODECK_GLOBAL_CACHE_TTL_DAYS", "30"))
@@ -74,14 +94,75 @@ class ImageHashCache:
         """Get global cache manifest path."""
         return self._get_global_cache_dir() / "manifest.json"
 
+    def _get_fd(self, cache_path: Path, create: bool = False) -> Optional[io.BufferedRandom]:
+        """Get the cached read/write handle for a manifest, opening it on first use.
+
+        Args:
+            cache_path: Manifest file path
+            create: Create the file if it does not exist yet
+
+        Returns:
+            Open file handle, or None if the file does not exist and create is False
+        """
+        fd = self._fds.get(cache_path)
+        if fd is not None and not fd.closed:
+            # Reopen if the manifest was deleted underneath us (e.g. session cleanup)
+            if os.fstat(fd.fileno()).st_nlink > 0:
+                self._fds.move_to_end(cache_path)
+                return fd
+            self._drop_fd(cache_path)
+
+        if not create and not cache_path.exists():
+            return None
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        flags = os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        fd = open(os.open(cache_path, flags), "r+b")
+        self._fds[cache_path] = fd
+        while len(self._fds) > _MAX_OPEN_MANIFESTS:
+            self._drop_fd(next(iter(self._fds)))
+        return fd
+
+    def _drop_fd(self, cache_path: Path) -> None:
+        """Close and forget the cached handle for a manifest."""
+        fd = self._fds.pop(cache_path, None)
+        if fd is not None:
+            try:
+                fd.close()
+            except OSError:
+                pass
+
+    def flush(self) -> None:
+        """Persist deferred stale/expired entry removals."""
+        pending_paths = {path for path, _ in self._stale_pending}
+        for cache_path in pending_paths:
+            if cache_path.exists():
+                self._save_cache_file(cache_path, self._load_cache_file(cache_path))
+            else:
+                self._stale_pending = {
+                    (path, key) for path, key in self._stale_pending if path != cache_path
+                }
+
+    def close(self) -> None:
+        """Flush deferred removals and close all open manifest handles."""
+        self.flush()
+        for cache_path in list(self._fds):
+            self._drop_fd(cache_path)
+
     def _load_cache_file(self, cache_path: Path) -> Dict:
         """Load cache from JSON file."""
-        if not cache_path.exists():
-            return {}
-
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache = json.load(f)
+            fd = self._get_fd(cache_path)
+            if fd is None:
+                return {}
+
+            fd.seek(0)
+            cache = json.loads(fd.read())
+
+            # Hide entries already known to be stale
+            for path, key in self._stale_pending:
+                if path == cache_path:
+                    cache.pop(key, None)
 
             # Filter expired entries for global cache
             if cache_path.name == "manifest.json":
@@ -103,22 +184,35 @@ class ImageHashCache:
                         glb_path.unlink()
 
                 if expired_keys:
-                    self._save_cache_file(cache_path, cache)
+                    # Keep the read path read-only; the next write persists this.
+                    # Until then later loads hide them above instead of
+                    # finding and unlinking them again.
+                    self._stale_pending.update((cache_path, key) for key in expired_keys)
                     logger.info(f"Cleaned up {len(expired_keys)} expired global cache entries")
 
             return cache
         except Exception as e:
             logger.error(f"Failed to load cache file {cache_path}: {e}")
+            self._drop_fd(cache_path)
             return {}
 
     def _save_cache_file(self, cache_path: Path, cache: Dict):
-        """Save cache to JSON file."""
+        """Save cache to JSON file, rewriting the cached handle in place."""
         try:
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache, f, indent=2, ensure_ascii=False)
+            data = json.dumps(cache, indent=2, ensure_ascii=False).encode("utf-8")
+            fd = self._get_fd(cache_path, create=True)
+            fd.seek(0)
+            fd.write(data)
+            fd.truncate()
+            fd.flush()
+
+            # Loaded dicts already exclude pending removals, so they are now on disk
+            self._stale_pending = {
+                (path, key) for path, key in self._stale_pending if path != cache_path
+            }
         except Exception as e:
             logger.error(f"Failed to save cache file {cache_path}: {e}")
+            self._drop_fd(cache_path)
 
     def generate_cache_key(self, image_hash: str, **params) -> str:
         """Generate cache key from image hash and parameters.
@@ -130,9 +224,26 @@ class ImageHashCache:
         Returns:
             Cache key string
         """
-        # Sort params for consistent key generation
-        param_str = "_".join(f"{k}_{v}" for k, v in sorted(params.items()))
-        return f"{image_hash}_{param_str}" if param_str else image_hash
+        if not params:
+            return image_hash
+
+        parts = [image_hash]
+        append = parts.append
+        found = 0
+        for k in _KEY_ORDER:
+            if k in params:
+                append(k)
+                append(str(params[k]))
+                found += 1
+
+        # Unknown parameters are rare; only those need sorting
+        if found != len(params):
+            parts = [image_hash]
+            for k, v in sorted(params.items()):
+                parts.append(k)
+                parts.append(str(v))
+
+        return "_".join(parts)
 
     def lookup_cache(self, image_path: str, session_id: str, **params) -> Optional[Tuple[str, Dict]]:
         """Check if asset exists in cache.
@@ -167,9 +278,8 @@ class ImageHashCache:
                 if cache_path.exists():
                     logger.info(f"Session cache hit for {session_id[:8]}: {cache_key[:16]}...")
                     return str(cache_path), entry["metadata"]
-                # Clean up stale entry if file doesn't exist
-                del session_cache[cache_key]
-                self._save_cache_file(session_cache_file, session_cache)
+                # Stale entry (file missing); drop it on the next manifest write
+                self._stale_pending.add((session_cache_file, cache_key))
 
         # Then check global cache (cross-session reuse)
         global_cache_file = self._get_global_cache_file()
@@ -188,9 +298,8 @@ class ImageHashCache:
                     )
 
                 return str(cache_path), entry["metadata"]
-            # Clean up stale entry if file doesn't exist
-            del global_cache[cache_key]
-            self._save_cache_file(global_cache_file, global_cache)
+            # Stale entry (file missing); drop it on the next manifest write
+            self._stale_pending.add((global_cache_file, cache_key))
 
         logger.debug(f"Cache miss: {cache_key[:16]}...")
         return None
@@ -220,13 +329,14 @@ class ImageHashCache:
 
         cache_key = self.generate_cache_key(image_hash, **params)
         glb_source = Path(glb_path)
+        now = time.time()
 
         # Store in session cache
         if session_id:
-            self._add_to_session_cache(session_id, cache_key, glb_source, metadata)
+            self._add_to_session_cache(session_id, cache_key, glb_source, metadata, now)
 
         # Store in global cache
-        self._add_to_global_cache(cache_key, glb_source, metadata)
+        self._add_to_global_cache(cache_key, glb_source, metadata, now)
 
         logger.info(f"Stored in cache: {cache_key[:16]}...")
 
@@ -238,7 +348,8 @@ class ImageHashCache:
         session_id: str,
         cache_key: str,
         glb_source: Path,
-        metadata: Dict
+        metadata: Dict,
+        now: Optional[float] = None
     ) -> None:
         """Add entry to session cache."""
         session_cache_file = self._get_session_cache_file(session_id)
@@ -252,14 +363,13 @@ class ImageHashCache:
         glb_dest.parent.mkdir(parents=True, exist_ok=True)
 
         if not glb_dest.exists() and glb_source != glb_dest:
-            import shutil
             shutil.copy2(glb_source, glb_dest)
 
         # Update cache entry
         session_cache[cache_key] = {
             "relative_path": relative_path,
             "metadata": metadata,
-            "timestamp": time.time()
+            "timestamp": now if now is not None else time.time()
         }
 
         self._save_cache_file(session_cache_file, session_cache)
@@ -268,7 +378,8 @@ class ImageHashCache:
         self,
         cache_key: str,
         glb_source: Path,
-        metadata: Dict
+        metadata: Dict,
+        now: Optional[float] = None
     ) -> None:
         """Add entry to global cache."""
         global_cache_dir = self._get_global_cache_dir()
@@ -280,13 +391,12 @@ class ImageHashCache:
         glb_dest.parent.mkdir(parents=True, exist_ok=True)
 
         if not glb_dest.exists() and glb_source != glb_dest:
-            import shutil
             shutil.copy2(glb_source, glb_dest)
 
         # Update cache entry
         global_cache[cache_key] = {
             "metadata": metadata,
-            "timestamp": time.time(),
+            "timestamp": now if now is not None else time.time(),
             "usage_count": global_cache.get(cache_key, {}).get("usage_count", 0) + 1
         }
 
@@ -303,42 +413,43 @@ class ImageHashCache:
 
         # Calculate total cache size
         total_size_mb = 0
+        file_count = 0
         for file in global_cache_dir.glob("*.glb"):
             total_size_mb += file.stat().st_size / (1024 * 1024)
+            file_count += 1
 
         if total_size_mb <= self.max_cache_size_mb:
             return
 
         logger.info(f"Cache size {total_size_mb:.1f}MB exceeds limit {self.max_cache_size_mb}MB, cleaning up...")
 
-        # Sort entries by timestamp and usage count
-        entries = []
-        for cache_key, entry in global_cache.items():
-            entries.append((
-                entry.get("timestamp", 0),
-                entry.get("usage_count", 0),
-                cache_key,
-                entry
-            ))
-
-        # Sort by oldest first, then lowest usage
-        entries.sort()
-
-        # Remove oldest entries until under limit
         target_size_mb = self.max_cache_size_mb * 0.8  # Leave some headroom
+
+        # Only the oldest / least-used few entries are ever evicted, so select
+        # an estimated k of them with a heap instead of sorting the manifest.
+        avg_file_mb = total_size_mb / max(file_count, 1)
         removed_count = 0
 
-        for timestamp, usage_count, cache_key, entry in entries:
-            glb_path = global_cache_dir / f"{cache_key}.glb"
-            if glb_path.exists():
-                file_size_mb = glb_path.stat().st_size / (1024 * 1024)
-                glb_path.unlink()
-                total_size_mb -= file_size_mb
+        while total_size_mb > target_size_mb and global_cache:
+            k = math.ceil((total_size_mb - target_size_mb) / max(avg_file_mb, 1e-6)) + 16
+            victims = heapq.nsmallest(
+                k,
+                global_cache.items(),
+                key=lambda kv: (kv[1].get("timestamp", 0), kv[1].get("usage_count", 0)),
+            )
+
+            # Remove oldest entries until under limit
+            for cache_key, entry in victims:
+                glb_path = global_cache_dir / f"{cache_key}.glb"
+                if glb_path.exists():
+                    file_size_mb = glb_path.stat().st_size / (1024 * 1024)
+                    glb_path.unlink()
+                    total_size_mb -= file_size_mb
+                    removed_count += 1
                 del global_cache[cache_key]
-                removed_count += 1
 
-            if total_size_mb <= target_size_mb:
-                break
+                if total_size_mb <= target_size_mb:
+                    break
 
         self._save_cache_file(global_cache_file, global_cache)
         logger.info(f"Cache cleanup completed: removed {removed_count} old entries")
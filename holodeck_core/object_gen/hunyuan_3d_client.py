@@ -7,15 +7,27 @@ Implements the 4-step process for Hunyuan 3D generation:
 4. Download model files from ResultFile3Ds[].Url (valid for 24 hours)
 """
 
+import asyncio
 import base64
+import functools
 import json
 import logging
+import mmap
 import os
+import random
+import re
+import shutil
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
+from urllib.parse import urlparse
 from dataclasses import dataclass
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from tencentcloud.common import credential
 from tencentcloud.common.profile.client_profile import ClientProfile
@@ -25,8 +37,50 @@ from tencentcloud.common.exception.tencent_cloud_sdk_exception import TencentClo
 
 from ..clients.base import Base3DClient, GenerationResult
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Chunk size for streaming model downloads to disk
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Adaptive status polling: delay grows from the base by the factor per
+# unchanged poll, capped at the max, plus up to the jitter
+_POLL_BASE_DELAY = 0.5
+_POLL_BACKOFF = 1.6
+_POLL_MAX_DELAY = 30.0
+_POLL_JITTER = 0.5
+
+# Submit retries for rate-limit errors, with exponential backoff from the
+# delay; after the last failure submits are refused for the cooldown.
+# SubmitHunyuanTo3DJob is not idempotent: only errors raised before a job can
+# exist are retried, since after network/internal errors the job may already
+# be created (and billed) under a JobId we never saw.
+_SUBMIT_RETRIES = 3
+_SUBMIT_RETRY_DELAY = 0.5
+_BREAKER_COOLDOWN = 30.0
+_RETRYABLE_SUBMIT_ERRORS = ("RequestLimitExceeded",)
+
+# Model file extensions recognised in download URLs
+_MODEL_EXTENSIONS = frozenset({'obj', 'stl', 'fbx', 'glb'})
+
+# Concurrent downloads per result set
+_MAX_DOWNLOAD_WORKERS = 8
+
+# QueryHunyuanTo3DJob responses shared across clients, keyed by JobId.
+# Finished jobs are kept as long as their JobId and URLs stay valid, so
+# retries of the same job skip the API entirely.
+_JOB_CACHE_MAX_ENTRIES = 256
+_JOB_FINAL_TTL = 24 * 3600
+_JOB_FINAL_STATUSES = frozenset({"DONE", "FAIL"})
+_IN_PROGRESS_STATUSES = frozenset({"WAIT", "RUN"})
+_job_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_job_cache_lock = threading.Lock()
+
 
 @dataclass
 class Hunyuan3DTask:
@@ -59,6 +113,64 @@ class Hunyuan3DResult:
             self.local_paths = []
 
 
+# A successful connection test is trusted for this many seconds
+_CONNECTION_OK_TTL = 300
+
+# .env locations searched for Hunyuan credentials, nearest first
+_ENV_PATHS = ('.env', '../.env', '../../.env', '../../../.env')
+_CREDENTIAL_KEYS = frozenset({'HUNYUAN_SECRET_ID', 'HUNYUAN_SECRET_KEY'})
+
+# One KEY=value assignment per line; the value may be double-quoted,
+# single-quoted or bare (ending at whitespace or a comment)
+_ENV_RE = re.compile(
+    r"""^[ \t]*([A-Z_][A-Z0-9_]*)[ \t]*=[ \t]*(?:"([^"\n]*)"|'([^'\n]*)'|([^\s#]*))""",
+    re.MULTILINE
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_env_once() -> None:
+    """Load Hunyuan credentials from a .env file into os.environ.
+
+    Runs once per process; later calls are no-ops.
+    """
+    # Load environment variables from .env file if not already set
+    if not os.getenv('HUNYUAN_SECRET_ID') or not os.getenv('HUNYUAN_SECRET_KEY'):
+        try:
+            from dotenv import load_dotenv
+            # Try to load from current directory or parent directory
+            loaded = False
+            for env_path in _ENV_PATHS:
+                if os.path.exists(env_path):
+                    load_dotenv(env_path)
+                    loaded = True
+                    logger.info(f"Loaded environment variables from {env_path}")
+                    break
+
+            if not loaded:
+                logger.warning("No .env file found, trying manual loading")
+        except ImportError:
+            logger.info("dotenv not available, trying manual loading")
+        except Exception as e:
+            logger.warning(f"Failed to load with dotenv: {e}, trying manual loading")
+
+        # Manual loading as fallback
+        if not os.getenv('HUNYUAN_SECRET_ID') or not os.getenv('HUNYUAN_SECRET_KEY'):
+            for env_path in _ENV_PATHS:
+                if os.path.exists(env_path):
+                    try:
+                        content = Path(env_path).read_text(encoding='utf-8')
+                        for match in _ENV_RE.finditer(content):
+                            key = match.group(1)
+                            if key in _CREDENTIAL_KEYS:
+                                value = next(v for v in match.group(2, 3, 4) if v is not None)
+                                os.environ[key] = value
+                                logger.info(f"Manually loaded {key} from {env_path}")
+                        break
+                    except Exception as e:
+                        logger.warning(f"Failed to manually load {env_path}: {e}")
+
+
 class Hunyuan3DClient(Base3DClient):
     """Tencent Hunyuan 3D client implementing the 4-step generation process."""
 
@@ -68,7 +180,7 @@ class Hunyuan3DClient(Base3DClient):
         secret_key: str,
         region: str = "ap-guangzhou",  # Default to ap-guangzhou (Guangzhou) for China
         timeout: int = 600,  # 10 minutes for 3D generation
-        poll_interval: int = 3,  # 3 seconds between polls (as per example)
+        poll_interval: Optional[float] = None,  # Minimum seconds between polls; adaptive when None
         endpoint: str = "ai3d.tencentcloudapi.com",  # AI3D endpoint
         api_version: str = "2025-05-13"  # API version
     ):
@@ -79,7 +191,8 @@ class Hunyuan3DClient(Base3DClient):
             secret_key: Tencent Cloud Secret Key
             region: API region (default: ap-guangzhou)
             timeout: Maximum time to wait for job completion (seconds)
-            poll_interval: Time between status polls (seconds)
+            poll_interval: Minimum time between status polls (seconds). Polls
+                start fast and back off while the job status is unchanged.
             endpoint: API endpoint (default: ai3d.tencentcloudapi.com)
             api_version: API version (default: 2025-05-13)
         """
@@ -101,6 +214,7 @@ class Hunyuan3DClient(Base3DClient):
         http_profile.endpoint = endpoint
         http_profile.reqMethod = "POST"
         http_profile.scheme = "https"
+        http_profile.keepAlive = True
 
         client_profile = ClientProfile()
         client_profile.httpProfile = http_profile
@@ -109,8 +223,57 @@ class Hunyuan3DClient(Base3DClient):
         # Use CommonClient for maximum compatibility with different API versions
         self.client = CommonClient("ai3d", api_version, self.cred, region, profile=client_profile)
 
+        # Submit/query calls go through the SDK's own requests.Session; give it
+        # a pooled adapter so polls reuse one kept-alive connection
+        sdk_session = getattr(getattr(getattr(self.client, "request", None), "conn", None), "_session", None)
+        if isinstance(sdk_session, requests.Session):
+            sdk_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            sdk_session.mount("https://", sdk_adapter)
+            sdk_session.mount("http://", sdk_adapter)
+        self._sdk_session = sdk_session
+
+        # Handlers for terminal job statuses; any other status keeps polling
+        self._status_handlers = {
+            "DONE": self._on_job_done,
+            "FAIL": self._on_job_failed,
+        }
+
+        # Monotonic time until which submits are refused after repeated failures
+        self._breaker_open_until = 0.0
+
+        # Monotonic time of the last successful connection test; cleared on API errors
+        self._last_conn_ok_ts: Optional[float] = None
+
+        # Pooled session for model downloads so multi-file results reuse connections
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+
         logger.info(f"Initialized Hunyuan 3D client for region {region}, endpoint {endpoint}, version {api_version}")
 
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._http.close()
+        if self._sdk_session is not None:
+            self._sdk_session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def get_service_type(self):
         """Get the service type for this client"""
         from ..clients.base import ServiceType
@@ -128,69 +291,21 @@ class Hunyuan3DClient(Base3DClient):
         pass
 
     @classmethod
-    def from_env(cls, region: str = "ap-guangzhou", timeout: int = 600, poll_interval: int = 3,
+    def from_env(cls, region: str = "ap-guangzhou", timeout: int = 600, poll_interval: Optional[float] = None,
                 endpoint: str = "ai3d.tencentcloudapi.com", api_version: str = "2025-05-13"):
         """Create Hunyuan3DClient from environment variables with automatic .env file loading.
 
         Args:
             region: API region (default: ap-guangzhou)
             timeout: Maximum time to wait for job completion (seconds)
-            poll_interval: Time between status polls (seconds)
+            poll_interval: Minimum time between status polls (seconds)
             endpoint: API endpoint (default: ai3d.tencentcloudapi.com)
             api_version: API version (default: 2025-05-13)
 
         Returns:
             Hunyuan3DClient instance
         """
-        import os
-
-        # Load environment variables from .env file if not already set
-        if not os.getenv('HUNYUAN_SECRET_ID') or not os.getenv('HUNYUAN_SECRET_KEY'):
-            try:
-                from dotenv import load_dotenv
-                # Try to load from current directory or parent directory
-                env_paths = ['.env', '../.env', '../../.env', '../../../.env']
-                loaded = False
-                for env_path in env_paths:
-                    if os.path.exists(env_path):
-                        load_dotenv(env_path)
-                        loaded = True
-                        logger.info(f"Loaded environment variables from {env_path}")
-                        break
-
-                if not loaded:
-                    logger.warning("No .env file found, trying manual loading")
-            except ImportError:
-                logger.info("dotenv not available, trying manual loading")
-            except Exception as e:
-                logger.warning(f"Failed to load with dotenv: {e}, trying manual loading")
-
-            # Manual loading as fallback
-            if not os.getenv('HUNYUAN_SECRET_ID') or not os.getenv('HUNYUAN_SECRET_KEY'):
-                env_paths = ['.env', '../.env', '../../.env', '../../../.env']
-                for env_path in env_paths:
-                    if os.path.exists(env_path):
-                        try:
-                            with open(env_path, 'r', encoding='utf-8') as f:
-                                for line in f:
-                                    line = line.strip()
-                                    if line and not line.startswith('#') and '=' in line:
-                                        # Handle potential quotes around the value
-                                        key, value = line.split('=', 1)
-                                        key = key.strip()
-                                        value = value.strip()
-
-                                        # Remove quotes if present
-                                        if (value.startswith('"') and value.endswith('"')) or \
-                                           (value.startswith("'") and value.endswith("'")):
-                                            value = value[1:-1]
-
-                                        if key in ['HUNYUAN_SECRET_ID', 'HUNYUAN_SECRET_KEY']:
-                                            os.environ[key] = value
-                                            logger.info(f"Manually loaded {key} from {env_path}")
-                            break
-                        except Exception as e:
-                            logger.warning(f"Failed to manually load {env_path}: {e}")
+        _load_env_once()
 
         # Check environment variables
         secret_id = os.getenv('HUNYUAN_SECRET_ID')
@@ -202,60 +317,82 @@ class Hunyuan3DClient(Base3DClient):
         return cls(secret_id, secret_key, region, timeout, poll_interval, endpoint, api_version)
 
     def _encode_image_to_base64(self, image_path: str) -> str:
-        """Convert image file to base64 string."""
+        """Convert image file to base64 string.
+
+        The file is memory-mapped so only the encoded copy is allocated.
+        Large images (over a few MB) are better submitted via image_url.
+        """
         try:
             with open(image_path, "rb") as image_file:
-                encoded_string = base64.b64encode(image_file.read()).decode('utf-8')
-            return encoded_string
+                if os.fstat(image_file.fileno()).st_size == 0:
+                    return ""
+                with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return base64.b64encode(mm).decode('ascii')
         except Exception as e:
             logger.error(f"Failed to encode image {image_path}: {e}")
             raise
 
     def _download_3d_models(self, model_urls: List[str], output_dir: str, file_types: Dict[str, str] = None) -> List[str]:
-        """Download 3D model files from URLs."""
-        local_paths = []
+        """Download 3D model files from URLs.
+
+        Files are fetched concurrently over the pooled session; the returned
+        paths keep the order of ``model_urls`` and skip failed downloads.
+        """
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
+        # Local paths are plain strings built from one directory prefix
+        prefix = os.path.join(str(output_path), "")
 
+        jobs = []
         for i, url in enumerate(model_urls):
-            try:
-                # Determine file extension
-                if file_types and url in file_types:
-                    extension = file_types[url].lower()
-                else:
-                    # Extract from URL or default to glb
-                    if '?' in url:
-                        url_base = url.split('?')[0]
-                    else:
-                        url_base = url
-
-                    if url_base.endswith('.obj'):
-                        extension = 'obj'
-                    elif url_base.endswith('.stl'):
-                        extension = 'stl'
-                    elif url_base.endswith('.fbx'):
-                        extension = 'fbx'
-                    else:
-                        extension = 'glb'  # Default format
-
-                filename = f"model_{i+1}.{extension}"
-                local_path = output_path / filename
-
-                logger.info(f"Downloading 3D model from {url}")
-                response = requests.get(url, timeout=60)
-                response.raise_for_status()
+            # Determine file extension
+            if file_types and url in file_types:
+                extension = file_types[url].lower()
+            else:
+                # Extract from the URL path or default to glb
+                extension = urlparse(url).path.rpartition('.')[2].lower()
+                if extension not in _MODEL_EXTENSIONS:
+                    extension = 'glb'  # Default format
 
-                with open(local_path, 'wb') as f:
-                    f.write(response.content)
+            jobs.append((url, f"{prefix}model_{i+1}.{extension}"))
 
-                local_paths.append(str(local_path))
-                logger.info(f"Downloaded 3D model to {local_path}")
+        if not jobs:
+            return []
 
-            except Exception as e:
-                logger.error(f"Failed to download model from {url}: {e}")
-                # Continue with other downloads
+        # Worker count stays below the adapter's pool_maxsize
+        with ThreadPoolExecutor(max_workers=min(_MAX_DOWNLOAD_WORKERS, len(jobs))) as executor:
+            futures = [executor.submit(self._download_one, url, local_path) for url, local_path in jobs]
+            results = [future.result() for future in futures]
+
+        return [path for path in results if path is not None]
+
+    def _download_one(self, url: str, local_path: str) -> Optional[str]:
+        """Download a single model file, returning its path or None on failure."""
+        # Stream into a temp file and move it into place only once complete,
+        # so a failed download never leaves a truncated model behind
+        tmp_path = f"{local_path}.part"
+        try:
+            logger.info(f"Downloading 3D model from {url}")
+            with self._http.get(url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                # Copy the raw stream so peak memory stays at one chunk;
+                # decode_content keeps gzip-encoded responses transparent
+                response.raw.decode_content = True
+                with open(tmp_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=_DOWNLOAD_CHUNK_SIZE)
+            os.replace(tmp_path, local_path)
+
+            logger.info(f"Downloaded 3D model to {local_path}")
+            return local_path
 
-        return local_paths
+        except Exception as e:
+            logger.error(f"Failed to download model from {url}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            # Continue with other downloads
+            return None
 
     def _submit_3d_job(self, task: Hunyuan3DTask) -> str:
         """Step 1: Submit 3D generation job (SubmitHunyuanTo3DJob).
@@ -295,8 +432,8 @@ class Hunyuan3DClient(Base3DClient):
 
         try:
             # Submit the job using CommonClient call method
-            resp = self.client.call("SubmitHunyuanTo3DJob", params)
-            resp_data = json.loads(resp)
+            resp = self._call_submit(task.task_id, params)
+            resp_data = _json_loads(resp)
 
             # Extract JobId from response
             job_id = resp_data["Response"]["JobId"]
@@ -306,12 +443,47 @@ class Hunyuan3DClient(Base3DClient):
             return job_id
 
         except TencentCloudSDKException as e:
+            self._last_conn_ok_ts = None
             logger.error(f"Failed to submit 3D job {task.task_id}: {e}")
             raise
         except Exception as e:
+            self._last_conn_ok_ts = None
             logger.error(f"Unexpected error submitting 3D job {task.task_id}: {e}")
             raise
 
+    def _call_submit(self, task_id: str, params: Dict[str, Any]) -> str:
+        """Call SubmitHunyuanTo3DJob, retrying rate-limit errors with backoff.
+
+        Other errors are raised unchanged, as the job may already have been
+        created. Once retries are exhausted the circuit breaker opens and
+        further submits fail immediately for ``_BREAKER_COOLDOWN`` seconds
+        instead of piling onto a rate-limited API.
+        """
+        if time.monotonic() < self._breaker_open_until:
+            raise TencentCloudSDKException(
+                "CircuitBreakerOpen",
+                f"Submits paused after repeated failures, retry in "
+                f"{self._breaker_open_until - time.monotonic():.0f}s"
+            )
+
+        for attempt in range(_SUBMIT_RETRIES + 1):
+            try:
+                return self.client.call("SubmitHunyuanTo3DJob", params)
+            except TencentCloudSDKException as e:
+                code = e.get_code() or ""
+                if not code.startswith(_RETRYABLE_SUBMIT_ERRORS):
+                    raise
+                if attempt == _SUBMIT_RETRIES:
+                    self._breaker_open_until = time.monotonic() + _BREAKER_COOLDOWN
+                    raise
+
+                delay = _SUBMIT_RETRY_DELAY * 2 ** (attempt + 1)
+                logger.warning(
+                    f"Rate limited submitting 3D job {task_id} "
+                    f"(attempt {attempt + 1}): {e}, retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+
     def _poll_job_status(self, job_id: str) -> Dict[str, Any]:
         """Step 3: Poll job status until completion (QueryHunyuanTo3DJob).
 
@@ -324,13 +496,14 @@ class Hunyuan3DClient(Base3DClient):
         start_time = time.time()
         consecutive_errors = 0
         max_consecutive_errors = 3
+        # Unchanged polls since the last status change, driving the backoff
+        attempt = 0
+        last_status = None
 
         while time.time() - start_time < self.timeout:
             try:
                 # Query job status using CommonClient call method
-                resp = self.client.call("QueryHunyuanTo3DJob", {"JobId": job_id})
-                resp_data = json.loads(resp)
-                result = resp_data["Response"]
+                result = self._cached_query(job_id)
 
                 # Reset error counter on successful query
                 consecutive_errors = 0
@@ -338,49 +511,26 @@ class Hunyuan3DClient(Base3DClient):
                 # Get job status
                 job_status = result.get("Status")
                 logger.info(f"Job {job_id} status: {job_status}")
-
-                # Check completion status
-                if job_status == "DONE":
-                    # Step 4: Get 3D model URLs (ResultFile3Ds[].Url)
-                    model_urls = []
-                    file_types = {}  # Track file types for proper extensions
-
-                    result_files = result.get("ResultFile3Ds", [])
-                    for file_3d in result_files:
-                        url = file_3d.get("Url")
-                        file_type = file_3d.get("Type", "glb").lower()
-                        if url:
-                            model_urls.append(url)
-                            file_types[url] = file_type
-
-                    logger.info(f"Download URLs are valid for 24 hours")
-
-                    return {
-                        "status": "success",
-                        "model_urls": model_urls,
-                        "file_types": file_types,
-                        "job_status": job_status
-                    }
-
-                elif job_status == "FAIL":
-                    error_code = result.get("ErrorCode", "Unknown")
-                    error_message = result.get("ErrorMessage", "Unknown error")
-                    logger.error(f"Job {job_id} failed: {error_code} - {error_message}")
-                    return {
-                        "status": "failed",
-                        "error": f"{error_code}: {error_message}",
-                        "job_status": job_status
-                    }
-
-                elif job_status in ["WAIT", "RUN"]:
-                    # Job still running, wait and poll again
-                    logger.info(f"Job {job_id} still processing ({job_status}), waiting {self.poll_interval}s...")
-                    time.sleep(self.poll_interval)
+                if job_status != last_status:
+                    attempt = 0
+                    last_status = job_status
+
+                # Finished jobs are handled by their status handler
+                handler = self._status_handlers.get(job_status)
+                if handler is not None:
+                    return handler(job_id, result)
+
+                # Job still running (or in an unknown state), wait and poll again
+                delay = self._poll_delay(attempt)
+                attempt += 1
+                if job_status in _IN_PROGRESS_STATUSES:
+                    logger.info(f"Job {job_id} still processing ({job_status}), waiting {delay:.1f}s...")
                 else:
                     logger.warning(f"Job {job_id} unknown status: {job_status}, waiting...")
-                    time.sleep(self.poll_interval)
+                time.sleep(delay)
 
             except TencentCloudSDKException as e:
+                self._last_conn_ok_ts = None
                 consecutive_errors += 1
                 logger.warning(f"Error querying job {job_id} (attempt {consecutive_errors}): {e}")
                 if consecutive_errors >= max_consecutive_errors:
@@ -390,8 +540,9 @@ class Hunyuan3DClient(Base3DClient):
                         "error": f"API query failed after {max_consecutive_errors} attempts: {e}",
                         "job_status": "ERROR"
                     }
-                time.sleep(self.poll_interval)
+                time.sleep(self._poll_delay(consecutive_errors))
             except Exception as e:
+                self._last_conn_ok_ts = None
                 consecutive_errors += 1
                 logger.warning(f"Unexpected error querying job {job_id} (attempt {consecutive_errors}): {e}")
                 if consecutive_errors >= max_consecutive_errors:
@@ -401,7 +552,7 @@ class Hunyuan3DClient(Base3DClient):
                         "error": f"Unexpected error after {max_consecutive_errors} attempts: {e}",
                         "job_status": "ERROR"
                     }
-                time.sleep(self.poll_interval)
+                time.sleep(self._poll_delay(consecutive_errors))
 
         # Timeout reached
         logger.error(f"Job {job_id} timed out after {self.timeout} seconds")
@@ -411,6 +562,80 @@ class Hunyuan3DClient(Base3DClient):
             "job_status": "TIMEOUT"
         }
 
+    def _on_job_done(self, job_id: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Step 4: Get 3D model URLs (ResultFile3Ds[].Url) of a finished job."""
+        # (url, file type) pairs; file types give downloads the right extension
+        pairs = [
+            (file_3d["Url"], file_3d.get("Type", "glb").lower())
+            for file_3d in result.get("ResultFile3Ds", [])
+            if file_3d.get("Url")
+        ]
+        model_urls = [url for url, _ in pairs]
+        file_types = dict(pairs)
+
+        logger.info(f"Download URLs are valid for 24 hours")
+
+        return {
+            "status": "success",
+            "model_urls": model_urls,
+            "file_types": file_types,
+            "job_status": "DONE"
+        }
+
+    def _on_job_failed(self, job_id: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the result of a failed job."""
+        error_code = result.get("ErrorCode", "Unknown")
+        error_message = result.get("ErrorMessage", "Unknown error")
+        logger.error(f"Job {job_id} failed: {error_code} - {error_message}")
+        return {
+            "status": "failed",
+            "error": f"{error_code}: {error_message}",
+            "job_status": "FAIL"
+        }
+
+    def _cached_query(self, job_id: str) -> Dict[str, Any]:
+        """Query job status, serving recent answers from the shared job cache.
+
+        Finished (DONE/FAIL) responses are cached for 24 hours; in-progress
+        ones only for half a poll interval so concurrent pollers of the same
+        job share a request without delaying status changes.
+        """
+        now = time.monotonic()
+        with _job_cache_lock:
+            entry = _job_cache.get(job_id)
+            if entry is not None:
+                if entry[0] > now:
+                    _job_cache.move_to_end(job_id)
+                    return entry[1]
+                del _job_cache[job_id]
+
+        resp = self.client.call("QueryHunyuanTo3DJob", {"JobId": job_id})
+        result = _json_loads(resp)["Response"]
+
+        if result.get("Status") in _JOB_FINAL_STATUSES:
+            ttl = _JOB_FINAL_TTL
+        else:
+            ttl = (self.poll_interval or _POLL_BASE_DELAY) / 2
+        with _job_cache_lock:
+            _job_cache[job_id] = (time.monotonic() + ttl, result)
+            _job_cache.move_to_end(job_id)
+            while len(_job_cache) > _JOB_CACHE_MAX_ENTRIES:
+                _job_cache.popitem(last=False)
+
+        return result
+
+    def _poll_delay(self, attempt: int) -> float:
+        """Seconds to wait before the next status poll.
+
+        Starts small so fast jobs are picked up quickly and grows while the
+        status stays the same, with ``poll_interval`` as a floor when set.
+        """
+        # The exponent is capped so very long waits cannot overflow the float
+        delay = min(_POLL_MAX_DELAY, _POLL_BASE_DELAY * _POLL_BACKOFF ** min(attempt, 16))
+        if self.poll_interval:
+            delay = max(delay, self.poll_interval)
+        return delay + random.uniform(0, _POLL_JITTER)
+
     def generate_3d_from_task(self, task: Hunyuan3DTask) -> Hunyuan3DResult:
         """Generate 3D asset from task using the complete 4-step process.
 
@@ -482,13 +707,21 @@ class Hunyuan3DClient(Base3DClient):
                 generation_time=generation_time
             )
 
-    def generate_3d_from_image(
+    async def generate_3d_from_task_async(self, task: Hunyuan3DTask) -> Hunyuan3DResult:
+        """Run :meth:`generate_3d_from_task` on a worker thread.
+
+        The submit/poll/download cycle blocks for up to ``timeout`` seconds;
+        running it off the event loop lets many jobs proceed concurrently.
+        """
+        return await asyncio.to_thread(self.generate_3d_from_task, task)
+
+    def generate_3d_from_image_sync(
         self,
         image_path: str,
         task_id: str,
         output_dir: str
     ) -> Hunyuan3DResult:
-        """Generate 3D asset from image file.
+        """Generate 3D asset from image file, blocking until the job finishes.
 
         Args:
             image_path: Path to input image
@@ -533,13 +766,13 @@ class Hunyuan3DClient(Base3DClient):
 
         return self.generate_3d_from_task(task)
 
-    def generate_3d_from_prompt(
+    def generate_3d_from_prompt_sync(
         self,
         prompt: str,
         task_id: str,
         output_dir: str
     ) -> Hunyuan3DResult:
-        """Generate 3D asset from text prompt.
+        """Generate 3D asset from text prompt, blocking until the job finishes.
 
         Args:
             prompt: Text description for 3D generation
@@ -557,111 +790,6 @@ class Hunyuan3DClient(Base3DClient):
 
         return self.generate_3d_from_task(task)
 
-    def test_connection(self) -> bool:
-        """Test API connection and credentials."""
-        try:
-            # Try to query a test job ID to test credentials
-            resp = self.client.call("QueryHunyuanTo3DJob", {"JobId": "test-connection"})
-            # If we get here, the connection works but job doesn't exist (expected)
-            logger.info("Connection test successful (unexpected success)")
-            return True
-        except Exception as e:
-            error_str = str(e).lower()
-            # Check for expected job not found errors
-            if any(keyword in error_str for keyword in ["invalidjobid", "jobnotfound", "invalid job", "job not found", "resourceinsufficient"]):
-                # This is expected for test job ID - connection works
-                logger.info("Connection test successful (expected job not found error)")
-                return True
-            else:
-                # Other errors indicate connection/credential issues
-                logger.error(f"Connection test failed: {e}")
-                return False
-
-
-# Convenience function for simple usage
-def generate_3d_asset(
-    image_path: Optional[str] = None,
-    image_url: Optional[str] = None,
-    prompt: Optional[str] = None,
-    output_dir: str = "output_3d",
-    task_id: Optional[str] = None
-) -> Hunyuan3DResult:
-    """Simple function to generate 3D asset from image or prompt.
-
-    Args:
-        image_path: Path to input image (optional)
-        image_url: URL to input image (optional)
-        prompt: Text prompt for generation (optional)
-        output_dir: Output directory
-        task_id: Task identifier (auto-generated if None)
-
-    Returns:
-        Generation result
-    """
-    import os
-
-    # Load environment variables from .env file if not already set
-    if not os.getenv('HUNYUAN_SECRET_ID') or not os.getenv('HUNYUAN_SECRET_KEY'):
-        try:
-            from dotenv import load_dotenv
-            # Try to load from current directory or parent directory
-            env_paths = ['.env', '../.env', '../../.env', '../../../.env']
-            loaded = False
-            for env_path in env_paths:
-                if os.path.exists(env_path):
-                    load_dotenv(env_path)
-                    loaded = True
-                    logger.info(f"Loaded environment variables from {env_path}")
-                    break
-
-            if not loaded:
-                logger.warning("No .env file found, trying manual loading")
-        except ImportError:
-            logger.info("dotenv not available, trying manual loading")
-        except Exception as e:
-            logger.warning(f"Failed to load with dotenv: {e}, trying manual loading")
-
-        # Manual loading as fallback
-        if not os.getenv('HUNYUAN_SECRET_ID') or not os.getenv('HUNYUAN_SECRET_KEY'):
-            env_paths = ['.env', '../.env', '../../.env', '../../../.env']
-            for env_path in env_paths:
-                if os.path.exists(env_path):
-                    try:
-                        with open(env_path, 'r', encoding='utf-8') as f:
-                            for line in f:
-                                line = line.strip()
-                                if line and not line.startswith('#') and '=' in line:
-                                    # Handle potential quotes around the value
-                                    key, value = line.split('=', 1)
-                                    key = key.strip()
-                                    value = value.strip()
-
-                                    # Remove quotes if present
-                                    if (value.startswith('"') and value.endswith('"')) or \
-                                       (value.startswith("'") and value.endswith("'")):
-                                        value = value[1:-1]
-
-                                    if key in ['HUNYUAN_SECRET_ID', 'HUNYUAN_SECRET_KEY']:
-                                        os.environ[key] = value
-                                        logger.info(f"Manually loaded {key} from {env_path}")
-                        break
-                    except Exception as e:
-                        logger.warning(f"Failed to manually load {env_path}: {e}")
-
-    if not task_id:
-        task_id = f"task_{int(time.time())}"
-
-    # Create client using environment variables with automatic .env loading
-    client = Hunyuan3DClient.from_env()
-
-    # Generate based on input type
-    if image_path:
-        return client.generate_3d_from_image(image_path, task_id, output_dir)
-    elif image_url:
-        return client.generate_3d_from_image_url(image_url, task_id, output_dir)
-    elif prompt:
-        return client.generate_3d_from_prompt(prompt, task_id, output_dir)
-
     async def generate_3d_from_image(
         self,
         image_path: Union[str, Path],
@@ -670,15 +798,14 @@ def generate_3d_asset(
         **kwargs
     ) -> GenerationResult:
         """Generate 3D model from input image - async wrapper."""
-        # Convert to sync call for now
         image_path = Path(image_path)
         if output_dir:
             output_dir = str(output_dir)
 
         task_id = kwargs.get('task_id', f"task_{int(time.time())}")
 
-        # Convert image to base64
-        image_base64 = self._encode_image_to_base64(str(image_path))
+        # Convert image to base64 off the event loop
+        image_base64 = await asyncio.to_thread(self._encode_image_to_base64, str(image_path))
 
         task = Hunyuan3DTask(
             task_id=task_id,
@@ -686,7 +813,7 @@ def generate_3d_asset(
             output_dir=output_dir
         )
 
-        result = self.generate_3d_from_task(task)
+        result = await self.generate_3d_from_task_async(task)
 
         return GenerationResult(
             success=result.success,
@@ -710,7 +837,6 @@ def generate_3d_asset(
         **kwargs
     ) -> GenerationResult:
         """Generate 3D model from text prompt - async wrapper."""
-        # Convert to sync call for now
         if output_dir:
             output_dir = str(output_dir)
 
@@ -722,7 +848,7 @@ def generate_3d_asset(
             output_dir=output_dir
         )
 
-        result = self.generate_3d_from_task(task)
+        result = await self.generate_3d_from_task_async(task)
 
         return GenerationResult(
             success=result.success,
@@ -736,4 +862,79 @@ def generate_3d_asset(
             },
             error=result.error_message,
             duration=result.generation_time
-        )
\ No newline at end of file
+        )
+
+    def test_connection(self) -> bool:
+        """Test API connection and credentials.
+
+        A success is reused for five minutes so frequent health checks do not
+        hit the API; any later API error forces a fresh test.
+        """
+        if self._last_conn_ok_ts is not None and time.monotonic() - self._last_conn_ok_ts < _CONNECTION_OK_TTL:
+            return True
+
+        try:
+            # Try to query a test job ID to test credentials
+            resp = self.client.call("QueryHunyuanTo3DJob", {"JobId": "test-connection"})
+            # If we get here, the connection works but job doesn't exist (expected)
+            logger.info("Connection test successful (unexpected success)")
+            self._last_conn_ok_ts = time.monotonic()
+            return True
+        except Exception as e:
+            error_str = str(e).lower()
+            # Check for expected job not found errors
+            if any(keyword in error_str for keyword in ["invalidjobid", "jobnotfound", "invalid job", "job not found", "resourceinsufficient"]):
+                # This is expected for test job ID - connection works
+                logger.info("Connection test successful (expected job not found error)")
+                self._last_conn_ok_ts = time.monotonic()
+                return True
+            else:
+                # Other errors indicate connection/credential issues
+                logger.error(f"Connection test failed: {e}")
+                return False
+
+
+@functools.lru_cache(maxsize=8)
+def _get_client(region: str = "ap-guangzhou", endpoint: str = "ai3d.tencentcloudapi.com",
+                api_version: str = "2025-05-13") -> Hunyuan3DClient:
+    """Shared client per (region, endpoint, api_version), created from env on first use.
+
+    The client is reused across calls and threads: its pooled sessions and the
+    job cache are safe to share, and each call works on its own job.
+    """
+    return Hunyuan3DClient.from_env(region=region, endpoint=endpoint, api_version=api_version)
+
+
+# Convenience function for simple usage
+def generate_3d_asset(
+    image_path: Optional[str] = None,
+    image_url: Optional[str] = None,
+    prompt: Optional[str] = None,
+    output_dir: str = "output_3d",
+    task_id: Optional[str] = None
+) -> Hunyuan3DResult:
+    """Simple function to generate 3D asset from image or prompt.
+
+    Args:
+        image_path: Path to input image (optional)
+        image_url: URL to input image (optional)
+        prompt: Text prompt for generation (optional)
+        output_dir: Output directory
+        task_id: Task identifier (auto-generated if None)
+
+    Returns:
+        Generation result
+    """
+    if not task_id:
+        task_id = f"task_{int(time.time())}"
+
+    # Shared client built from environment variables with automatic .env loading
+    client = _get_client()
+
+    # Generate based on input type
+    if image_path:
+        return client.generate_3d_from_image_sync(image_path, task_id, output_dir)
+    elif image_url:
+        return client.generate_3d_from_image_url(image_url, task_id, output_dir)
+    elif prompt:
+        return client.generate_3d_from_prompt_sync(prompt, task_id, output_dir)
@@ -18,28 +18,79 @@ LLM命名服务 (已废弃)
 - 向后兼容的API
 """
 
+import asyncio
+import threading
+import time
 import warnings
 import logging
-from typing import Optional
+from collections import OrderedDict
 from pathlib import Path
-
-# 发出废弃警告
-warnings.warn(
-    "LLMNamingService is deprecated and will be removed in a future version. "
-    "Use EnhancedLLMNamingService instead. "
-    "Migration: from holodeck_core.object_gen.enhanced_llm_naming_service import EnhancedLLMNamingService",
-    DeprecationWarning,
-    stacklevel=2
-)
-
-from .enhanced_llm_naming_service import EnhancedLLMNamingService
-
-
-class LLMNamingService(EnhancedLLMNamingService):
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .enhanced_llm_naming_service import EnhancedLLMNamingService
+
+logger = logging.getLogger(__name__)
+
+# 废弃警告在首次实例化时发出（而非导入时），每个进程只警告一次
+_warned = False
+
+# extract_style_and_material 的固定返回值 (风格, 材质)
+_DEFAULT_STYLE_MATERIAL = ("通用", "标准")
+
+# 同步调用共用的后台事件循环，首次使用时在守护线程中启动
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """获取（必要时启动）后台事件循环"""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="llm-naming-loop", daemon=True
+                ).start()
+                _loop = loop
+    return _loop
+
+
+# 旧版同步调用的结果缓存：命中时无需进入事件循环；
+# 与共享服务相同的1小时有效期，最多保留512条
+_RESULT_CACHE_TTL = 3600
+_RESULT_CACHE_MAX_ENTRIES = 512
+_result_cache: "OrderedDict[Tuple, Tuple[float, str]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+# 所有旧版实例共用的增强版服务，首次实例化时创建
+_shared_service: Optional["EnhancedLLMNamingService"] = None
+_shared_lock = threading.Lock()
+
+
+def _get_shared_service() -> "EnhancedLLMNamingService":
+    """获取（必要时创建）共享的增强版命名服务"""
+    global _shared_service
+    if _shared_service is None:
+        with _shared_lock:
+            if _shared_service is None:
+                # 延迟导入：仅导入本模块不加载增强版服务
+                from .enhanced_llm_naming_service import EnhancedLLMNamingService
+                _shared_service = EnhancedLLMNamingService(
+                    config_manager=None,  # 将自动创建默认配置管理器
+                    cache_ttl=3600,       # 默认缓存1小时
+                    enable_image_analysis=True
+                )
+    return _shared_service
+
+
+class LLMNamingService:
     """
     旧的LLM命名服务 - 已废弃
 
-    此类现在继承自EnhancedLLMNamingService以保持向后兼容性。
+    此类现在是共享EnhancedLLMNamingService实例的轻量代理，
+    未定义的属性和方法都会转发给该实例，以保持向后兼容性。
     建议尽快迁移到直接使用EnhancedLLMNamingService。
     """
 
@@ -50,25 +101,29 @@ class LLMNamingService(EnhancedLLMNamingService):
         Args:
             hybrid_client: 混合分析客户端 (在新服务中不再需要)
         """
-        # 发出废弃警告
-        warnings.warn(
-            "LLMNamingService is deprecated. Use EnhancedLLMNamingService instead.",
-            DeprecationWarning,
-            stacklevel=2
-        )
-
-        self.logger = logging.getLogger(__name__)
-
-        # 调用父类初始化
-        super().__init__(
-            config_manager=None,  # 将自动创建默认配置管理器
-            cache_ttl=3600,       # 默认缓存1小时
-            enable_image_analysis=True
-        )
+        global _warned
+        if not _warned:
+            _warned = True
+            warnings.warn(
+                "LLMNamingService is deprecated and will be removed in a future version. "
+                "Use EnhancedLLMNamingService instead. "
+                "Migration: from holodeck_core.object_gen.enhanced_llm_naming_service import EnhancedLLMNamingService",
+                DeprecationWarning,
+                stacklevel=2
+            )
+
+        # 共享增强版服务，避免每个实例重复创建配置管理器和缓存
+        self._service = _get_shared_service()
 
         # 保留旧的hybrid_client参数以保持兼容性
         if hybrid_client:
-            self.logger.warning("hybrid_client参数在新服务中不再使用，将被忽略")
+            logger.warning("hybrid_client参数在新服务中不再使用，将被忽略")
+
+    def __getattr__(self, name):
+        # 仅在常规属性查找失败时调用，转发给共享服务
+        if name == "_service":
+            raise AttributeError(name)
+        return getattr(self._service, name)
 
     def generate_object_name(self, description: str, object_name: str, image_path: Optional[Path] = None) -> Optional[str]:
         """
@@ -84,50 +139,57 @@ class LLMNamingService(EnhancedLLMNamingService):
         Returns:
             生成的命名，格式：风格+材质+主体
         """
-        # 发出废弃警告
-        warnings.warn(
-            "LLMNamingService.generate_object_name() is deprecated. "
-            "Use EnhancedLLMNamingService.generate_object_name() instead.",
-            DeprecationWarning,
-            stacklevel=2
-        )
+        # 图像按路径和修改时间/大小区分，图像被替换后不会命中旧结果
+        image_key = None
+        if image_path:
+            try:
+                st = Path(image_path).stat()
+                image_key = (str(image_path), st.st_mtime_ns, st.st_size)
+            except OSError:
+                image_key = (str(image_path),)
+        cache_key = (description, object_name, image_key)
+
+        now = time.monotonic()
+        with _result_cache_lock:
+            entry = _result_cache.get(cache_key)
+            if entry is not None:
+                if entry[0] > now:
+                    _result_cache.move_to_end(cache_key)
+                    return entry[1]
+                del _result_cache[cache_key]
 
         # 调用增强版实现
-        import asyncio
-
         try:
-            # 在同步上下文中运行异步方法
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(
-                super().generate_object_name(description, object_name, image_path)
+            # 在后台事件循环中运行异步方法；调用方是否已处于事件循环中都可使用
+            future = asyncio.run_coroutine_threadsafe(
+                self._service.generate_object_name(description, object_name, image_path),
+                _get_loop()
             )
-            loop.close()
-            return result
+            result = future.result()
         except Exception as e:
-            self.logger.error(f"LLM命名失败: {e}")
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(f"LLM命名失败: {e}")
             return None
 
+        if result:
+            with _result_cache_lock:
+                _result_cache[cache_key] = (time.monotonic() + _RESULT_CACHE_TTL, result)
+                _result_cache.move_to_end(cache_key)
+                if len(_result_cache) > _RESULT_CACHE_MAX_ENTRIES:
+                    _result_cache.popitem(last=False)
+        return result
+
     def extract_style_and_material(self, description: str) -> tuple[str, str]:
         """
         从描述中提取风格和材质信息 (已废弃)
 
-        此方法现在委托给EnhancedLLMNamingService的实现。
+        不再调用LLM，始终返回固定的默认值 ("通用", "标准")。
 
         Args:
-            description: 对象描述
+            description: 对象描述 (未使用)
 
         Returns:
-            (风格, 材质) 元组
+            默认的 (风格, 材质) 元组
         """
-        # 发出废弃警告
-        warnings.warn(
-            "LLMNamingService.extract_style_and_material() is deprecated. "
-            "Use EnhancedLLMNamingService._extract_style_and_material() instead.",
-            DeprecationWarning,
-            stacklevel=2
-        )
-
-        # 使用默认值返回，因为新方法需要异步调用
-        self.logger.warning("extract_style_and_material方法在新服务中需要异步调用，返回默认值")
-        return "通用", "标准"
\ No newline at end of file
+        # 新方法需要异步调用，这里始终返回默认值
+        return _DEFAULT_STYLE_MATERIAL
\ No newline at end of file
@@ -8,22 +8,88 @@ This module provides comprehensive material management for 3D assets including:
 - Blender integration for material handling
 """
 
+import hashlib
 import json
 import logging
+import mmap
 import os
 import shutil
+import struct
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union, Any
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union, Any
 
 import numpy as np
+import PIL
 from PIL import Image
 
 # Import available schemas - MaterialSchema and TextureSchema will be defined locally if needed
 from holodeck_core.storage import WorkspaceManager
 
+from ._texture_kernel import MISSING, NOT_POW2, NOT_SQUARE, size_flags
+
+try:
+    import orjson
+
+    def _registry_dumps(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+
+    _registry_loads = orjson.loads
+except ImportError:
+    def _registry_dumps(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    _registry_loads = json.loads
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+
+# Pillow-SIMD is a drop-in build with faster resize kernels; its versions
+# carry a ".postN" suffix
+PILLOW_SIMD = ".post" in PIL.__version__
+
+# Texture file types stored as-is when no mode conversion is needed
+_PASSTHROUGH_SUFFIXES = frozenset({".png", ".jpg", ".jpeg"})
+
+# Texture batches larger than this are resized/generated on worker threads
+# (Pillow releases the GIL while resizing and encoding)
+_PARALLEL_TEXTURE_MIN_JOBS = 2
+_MAX_TEXTURE_WORKERS = 8
+
+# Parallel copies when exporting a material's textures
+_MAX_EXPORT_WORKERS = 8
+
+# Validation batches with at least this many texture files list their
+# directories once instead of stat()ing each file
+_LISTING_MIN_FILES = 64
+
+# Seconds a generated timestamp is reused for material created/modified times
+_TIMESTAMP_REFRESH = 1.0
+
+# Header sniffing: bytes read per texture, and channel counts per PNG color type
+_HEADER_SNIFF_BYTES = 64 * 1024
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+# Channel counts of common PIL image modes (others fall back to getbands())
+_MODE_CHANNELS = {"1": 1, "L": 1, "P": 1, "I": 1, "F": 1, "I;16": 1, "LA": 2, "PA": 2,
+                  "RGB": 3, "YCbCr": 3, "LAB": 3, "HSV": 3, "RGBA": 4, "RGBX": 4, "CMYK": 4}
+# JPEG start-of-frame markers (excluding DHT, JPG and DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# Image modes Image.reduce() supports
+_REDUCIBLE_MODES = frozenset({"L", "LA", "RGB", "RGBA", "RGBX", "I", "F"})
+
 
 class TextureType(Enum):
     """PBR texture types"""
@@ -44,6 +110,34 @@ class MaterialQuality(Enum):
     ULTRA = "ultra"  # 4096x4096
 
 
+# Texture size per quality level
+_QUALITY_SIZES = {
+    MaterialQuality.LOW: (512, 512),
+    MaterialQuality.MEDIUM: (1024, 1024),
+    MaterialQuality.HIGH: (2048, 2048),
+    MaterialQuality.ULTRA: (4096, 4096)
+}
+
+# Fixed small-int codes for enums in the binary registry; never renumber
+_TEXTURE_TYPE_CODES = {
+    TextureType.ALBEDO: 0,
+    TextureType.METALLIC: 1,
+    TextureType.ROUGHNESS: 2,
+    TextureType.NORMAL: 3,
+    TextureType.HEIGHT: 4,
+    TextureType.AO: 5,
+    TextureType.EMISSION: 6,
+}
+_QUALITY_CODES = {
+    MaterialQuality.LOW: 0,
+    MaterialQuality.MEDIUM: 1,
+    MaterialQuality.HIGH: 2,
+    MaterialQuality.ULTRA: 3,
+}
+_TEXTURE_TYPES_BY_CODE = {code: texture_type for texture_type, code in _TEXTURE_TYPE_CODES.items()}
+_QUALITIES_BY_CODE = {code: quality for quality, code in _QUALITY_CODES.items()}
+
+
 @dataclass
 class TextureInfo:
     """Information about a texture map"""
@@ -68,27 +162,269 @@ class MaterialInfo:
     modified_at: str = ""
 
 
+def _sniff_image_header(path: Path) -> Optional[Tuple[Tuple[int, int], int, str]]:
+    """
+    Read size, channel count and format from a PNG or JPEG header
+
+    Only the first bytes of the file are read; nothing is decoded.
+
+    Args:
+        path: Image file path
+
+    Returns:
+        ((width, height), channels, format) or None for other or unusual files
+    """
+    with open(path, "rb") as f:
+        head = f.read(_HEADER_SNIFF_BYTES)
+
+    # PNG: signature, then the IHDR chunk
+    if head.startswith(_PNG_SIGNATURE) and head[12:16] == b"IHDR" and len(head) >= 26:
+        width, height, _, color_type = struct.unpack(">IIBB", head[16:26])
+        channels = _PNG_CHANNELS.get(color_type)
+        return ((width, height), channels, "PNG") if channels else None
+
+    # JPEG: walk marker segments to the first start-of-frame
+    if head.startswith(b"\xff\xd8"):
+        pos = 2
+        while pos + 4 <= len(head):
+            if head[pos] != 0xFF:
+                return None
+            marker = head[pos + 1]
+            if marker == 0xFF:
+                # Fill byte
+                pos += 1
+                continue
+            if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+                # Standalone markers without a length
+                pos += 2
+                continue
+            if marker == 0xDA:
+                # Scan data before any frame header
+                return None
+            (length,) = struct.unpack(">H", head[pos + 2:pos + 4])
+            if marker in _JPEG_SOF_MARKERS:
+                if pos + 10 > len(head):
+                    return None
+                height, width, channels = struct.unpack(">HHB", head[pos + 5:pos + 10])
+                return (width, height), channels, "JPEG"
+            pos += 2 + length
+
+    return None
+
+
+def _read_texture_header(path: Path) -> Tuple[Tuple[int, int], int, str]:
+    """Size, channel count and format of a texture, sniffed or via PIL"""
+    header = _sniff_image_header(path)
+    if header is not None:
+        return header
+
+    with Image.open(path) as img:
+        channels = _MODE_CHANNELS.get(img.mode) or len(img.getbands())
+        return img.size, channels, img.format or "UNKNOWN"
+
+
+# (monotonic time, ISO timestamp) last handed out by _get_timestamp
+_timestamp_cache: Optional[Tuple[float, str]] = None
+
+def _make_exists_checker() -> Callable[[Path], bool]:
+    """
+    Create a file existence check backed by directory listings
+
+    One os.scandir per directory replaces a stat() per file when many
+    textures are checked. Listings live only as long as the returned
+    function, so use a fresh checker per batch of checks.
+
+    Returns:
+        Function telling whether a path is in its directory's listing
+    """
+    listings: Dict[Path, Set[str]] = {}
+
+    def exists(path: Path) -> bool:
+        names = listings.get(path.parent)
+        if names is None:
+            try:
+                with os.scandir(path.parent) as entries:
+                    names = {dir_entry.name for dir_entry in entries}
+            except OSError:
+                names = set()
+            listings[path.parent] = names
+        return path.name in names
+
+    return exists
+
+
+def _texture_digest(path: Path, *params: str) -> str:
+    """
+    Hash a texture file's bytes together with processing parameters
+
+    Args:
+        path: Texture file path
+        params: Processing parameters that affect the output
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+    for param in params:
+        digest.update(b"\0" + param.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _link_or_copy(src: Path, dst: Path) -> Path:
+    """Hardlink a file, copying it where links are unsupported or cross-device"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _fast_copy(src: Path, dst: Path) -> Path:
+    """
+    Copy a file with metadata, kernel-side via copy_file_range where available
+
+    Args:
+        src: Source file
+        dst: Destination file
+
+    Returns:
+        Destination path
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                shutil.copystat(src, dst)
+                return dst
+        except OSError:
+            # Unsupported filesystem or cross-device copy; use the portable path
+            pass
+
+    shutil.copy2(src, dst)
+    return dst
+
+
+def _resize_texture_file(texture_path: Path, output_path: Path,
+                         target_size: Tuple[int, int]) -> Path:
+    """Resize a texture file to target size"""
+    with Image.open(texture_path) as img:
+        # JPEG can scale by 1/2, 1/4 or 1/8 while decoding; stop at ~2x the
+        # target like the box reduction below
+        if img.format == "JPEG":
+            img.draft(img.mode, (2 * target_size[0], 2 * target_size[1]))
+
+        # For large downscales, box-reduce by an integer factor first
+        # (cheap C pass) so LANCZOS only works from ~2x the target
+        factor = min(img.width // (2 * target_size[0]), img.height // (2 * target_size[1]))
+        if factor >= 2 and img.mode in _REDUCIBLE_MODES:
+            img = img.reduce(factor)
+
+        # Use LANCZOS for high-quality downsampling
+        resized_img = img.resize(target_size, Image.Resampling.LANCZOS)
+        resized_img.save(output_path, optimize=True, quality=95)
+
+    return output_path
+
+
+def _write_default_texture(output_path: Path, size: Tuple[int, int],
+                           color: Tuple[int, int, int]) -> Path:
+    """Write a solid color texture"""
+    # A single color compresses well without the extra optimize pass
+    img = Image.new("RGB", size, color)
+    img.save(output_path, optimize=False)
+    return output_path
+
+
+def _run_texture_jobs(func: Callable[..., Path], jobs: List[Tuple]) -> List[Path]:
+    """
+    Run independent texture jobs, on worker threads for larger batches
+
+    Args:
+        func: Texture function
+        jobs: Argument tuples, one per call
+
+    Returns:
+        Results in job order
+    """
+    if len(jobs) <= _PARALLEL_TEXTURE_MIN_JOBS:
+        return [func(*args) for args in jobs]
+
+    workers = min(len(jobs), os.cpu_count() or 1, _MAX_TEXTURE_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, *zip(*jobs)))
+
+
 class MaterialManager:
     """
     Manages PBR materials and textures for 3D assets
     """
 
-    def __init__(self, workspace_manager: WorkspaceManager):
+    def __init__(self, workspace_manager: WorkspaceManager,
+                 human_readable_registry: Optional[bool] = None):
         self.workspace = workspace_manager
         self.logger = logging.getLogger(__name__)
         self.materials_dir = self.workspace.workspace_root / "materials"
         self.textures_dir = self.workspace.workspace_root / "textures"
         self.cache_dir = self.workspace.workspace_root / "cache" / "materials"
+        self.defaults_dir = self.cache_dir / "defaults"
+
+        self.logger.debug(
+            f"Texture processing with Pillow {PIL.__version__}"
+            f"{' (SIMD build)' if PILLOW_SIMD else ''}"
+        )
 
         # Create directories
         self.materials_dir.mkdir(parents=True, exist_ok=True)
         self.textures_dir.mkdir(parents=True, exist_ok=True)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Material registry
+        # Generated default textures, keyed by (type, size, color)
+        self._default_cache: Dict[Tuple[TextureType, Tuple[int, int], Tuple[int, int, int]], Path] = {}
+
+        # Registry format: msgpack when available, JSON when asked for a
+        # human-readable registry (HOLODECK_HUMAN_READABLE_REGISTRY=1)
+        if human_readable_registry is None:
+            human_readable_registry = os.getenv("HOLODECK_HUMAN_READABLE_REGISTRY", "0") == "1"
+        self._binary_registry = MSGPACK_AVAILABLE and not human_readable_registry
+
+        # Material registry; writes are deferred while a batch() is open
         self.materials: Dict[str, MaterialInfo] = {}
+        self._dirty = False
+        self._batch_depth = 0
         self._load_material_registry()
 
+    @contextmanager
+    def batch(self) -> Iterator["MaterialManager"]:
+        """
+        Coalesce registry writes for several operations into one
+
+        The registry is saved once when the outermost batch exits, if any
+        operation inside it changed the registry.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._save_material_registry()
+
+    def _mark_dirty(self):
+        """Record a registry change, saving now unless a batch is open"""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._save_material_registry()
+
     def create_material(self, name: str, quality: MaterialQuality = MaterialQuality.MEDIUM) -> str:
         """
         Create a new material
@@ -110,7 +446,7 @@ class MaterialManager:
         )
 
         self.materials[material_id] = material
-        self._save_material_registry()
+        self._mark_dirty()
 
         self.logger.info(f"Created material: {name} (ID: {material_id})")
         return material_id
@@ -137,24 +473,22 @@ class MaterialManager:
 
         try:
             # Process and optimize texture
-            processed_path = self._process_texture(texture_path, texture_type)
+            processed_path, size, mode, image_format = self._process_texture(texture_path, texture_type)
 
-            # Get texture info
-            with Image.open(processed_path) as img:
-                texture_info = TextureInfo(
-                    path=processed_path,
-                    type=texture_type,
-                    size=img.size,
-                    channels=len(img.getbands()),
-                    format=img.format or "UNKNOWN",
-                    is_srgb=texture_type in [TextureType.ALBEDO, TextureType.EMISSION]
-                )
+            texture_info = TextureInfo(
+                path=processed_path,
+                type=texture_type,
+                size=size,
+                channels=_MODE_CHANNELS[mode],
+                format=image_format,
+                is_srgb=texture_type in [TextureType.ALBEDO, TextureType.EMISSION]
+            )
 
             # Add to material
             self.materials[material_id].textures[texture_type] = texture_info
             self.materials[material_id].modified_at = self._get_timestamp()
 
-            self._save_material_registry()
+            self._mark_dirty()
             self.logger.info(f"Added {texture_type.value} texture to material {material_id}")
             return True
 
@@ -181,7 +515,7 @@ class MaterialManager:
         self.materials[material_id].properties[property_name] = value
         self.materials[material_id].modified_at = self._get_timestamp()
 
-        self._save_material_registry()
+        self._mark_dirty()
         return True
 
     def get_material(self, material_id: str) -> Optional[MaterialInfo]:
@@ -218,18 +552,24 @@ class MaterialManager:
         if material_id not in self.materials:
             return False
 
-        # Delete texture files
+        # Delete texture files, keeping ones shared with other materials
         material = self.materials[material_id]
+        shared_paths = {
+            texture_info.path
+            for other_id, other in self.materials.items() if other_id != material_id
+            for texture_info in other.textures.values()
+        }
         for texture_info in material.textures.values():
+            if texture_info.path in shared_paths:
+                continue
             try:
-                if texture_info.path.exists():
-                    texture_info.path.unlink()
+                texture_info.path.unlink(missing_ok=True)
             except Exception as e:
                 self.logger.warning(f"Failed to delete texture {texture_info.path}: {e}")
 
         # Remove from registry
         del self.materials[material_id]
-        self._save_material_registry()
+        self._mark_dirty()
 
         self.logger.info(f"Deleted material {material_id}")
         return True
@@ -251,30 +591,37 @@ class MaterialManager:
         material = self.materials[material_id]
         target_size = self._get_texture_size(target_quality)
 
-        for texture_type, texture_info in material.textures.items():
-            try:
-                # Resize texture if needed
-                if texture_info.size != target_size:
-                    resized_path = self._resize_texture(texture_info.path, target_size)
-
-                    # Update texture info
-                    with Image.open(resized_path) as img:
-                        material.textures[texture_type] = TextureInfo(
-                            path=resized_path,
-                            type=texture_type,
-                            size=img.size,
-                            channels=len(img.getbands()),
-                            format=img.format or "UNKNOWN",
-                            is_srgb=texture_info.is_srgb
-                        )
+        # Resize textures that are not at the target size
+        pending = [(texture_type, texture_info)
+                   for texture_type, texture_info in material.textures.items()
+                   if texture_info.size != target_size]
 
-            except Exception as e:
-                self.logger.error(f"Failed to optimize texture {texture_type.value}: {e}")
-                return False
+        try:
+            resized_paths = _run_texture_jobs(
+                _resize_texture_file,
+                [(texture_info.path, self._resized_texture_path(texture_info.path, target_size), target_size)
+                 for _, texture_info in pending]
+            )
+
+            # Update texture info
+            for (texture_type, texture_info), resized_path in zip(pending, resized_paths):
+                size, channels, image_format = _read_texture_header(resized_path)
+                material.textures[texture_type] = TextureInfo(
+                    path=resized_path,
+                    type=texture_type,
+                    size=size,
+                    channels=channels,
+                    format=image_format,
+                    is_srgb=texture_info.is_srgb
+                )
+
+        except Exception as e:
+            self.logger.error(f"Failed to optimize textures for material {material_id}: {e}")
+            return False
 
         material.quality = target_quality
         material.modified_at = self._get_timestamp()
-        self._save_material_registry()
+        self._mark_dirty()
 
         self.logger.info(f"Optimized textures for material {material_id} to {target_quality.value}")
         return True
@@ -292,39 +639,35 @@ class MaterialManager:
         if material_id not in self.materials:
             return False
 
-        material = self.materials[material_id]
-        base_size = self._get_texture_size(material.quality)
-
-        # Define default textures for missing types
-        defaults = {
-            TextureType.METALLIC: (128, 128, 128),  # Gray for non-metallic
-            TextureType.ROUGHNESS: (192, 192, 192),  # Medium roughness
-            TextureType.AO: (255, 255, 255),        # No occlusion
-            TextureType.EMISSION: (0, 0, 0),         # No emission
-        }
+        with self.batch():
+            material = self.materials[material_id]
+            base_size = self._get_texture_size(material.quality)
+
+            # Define default textures for missing types
+            defaults = {
+                TextureType.METALLIC: (128, 128, 128),  # Gray for non-metallic
+                TextureType.ROUGHNESS: (192, 192, 192),  # Medium roughness
+                TextureType.AO: (255, 255, 255),        # No occlusion
+                TextureType.EMISSION: (0, 0, 0),         # No emission
+            }
+
+            missing = [(texture_type, default_color)
+                       for texture_type, default_color in defaults.items()
+                       if texture_type not in material.textures]
+
+            # Generate normal map if missing (flat normal)
+            if TextureType.NORMAL not in material.textures:
+                missing.append((TextureType.NORMAL, (128, 128, 255)))
 
-        for texture_type, default_color in defaults.items():
-            if texture_type not in material.textures:
-                try:
-                    texture_path = self._generate_default_texture(
-                        texture_type, base_size, default_color
-                    )
-                    self.add_texture(material_id, texture_path, texture_type)
-                except Exception as e:
-                    self.logger.error(f"Failed to generate {texture_type.value}: {e}")
-                    return False
-
-        # Generate normal map if missing (flat normal)
-        if TextureType.NORMAL not in material.textures:
             try:
-                normal_path = self._generate_default_texture(
-                    TextureType.NORMAL, base_size, (128, 128, 255)
-                )
-                self.add_texture(material_id, normal_path, TextureType.NORMAL)
+                texture_paths = self._generate_default_textures(missing, base_size)
             except Exception as e:
-                self.logger.error(f"Failed to generate normal map: {e}")
+                self.logger.error(f"Failed to generate missing textures: {e}")
                 return False
 
+            for (texture_type, _), texture_path in zip(missing, texture_paths):
+                self.add_texture(material_id, texture_path, texture_type)
+
         self.logger.info(f"Generated missing textures for material {material_id}")
         return True
 
@@ -348,12 +691,16 @@ class MaterialManager:
 
         try:
             # Copy all textures
-            exported_textures = {}
-            for texture_type, texture_info in material.textures.items():
-                if texture_info.path.exists():
-                    dest_path = export_dir / f"{texture_type.value}{texture_info.path.suffix}"
-                    shutil.copy2(texture_info.path, dest_path)
-                    exported_textures[texture_type.value] = dest_path.name
+            copies = {
+                texture_type.value: (texture_info.path,
+                                     export_dir / f"{texture_type.value}{texture_info.path.suffix}")
+                for texture_type, texture_info in material.textures.items()
+                if texture_info.path.exists()
+            }
+            if copies:
+                with ThreadPoolExecutor(max_workers=min(len(copies), _MAX_EXPORT_WORKERS)) as pool:
+                    list(pool.map(lambda pair: _fast_copy(*pair), copies.values()))
+            exported_textures = {name: dest_path.name for name, (_, dest_path) in copies.items()}
 
             # Create material JSON
             material_data = {
@@ -389,59 +736,93 @@ class MaterialManager:
         Returns:
             Material ID or None on failure
         """
-        material_id = self.create_material(name, quality)
+        with self.batch():
+            material_id = self.create_material(name, quality)
 
-        for texture_type, texture_path in texture_paths.items():
-            if not self.add_texture(material_id, texture_path, texture_type):
-                self.logger.error(f"Failed to add {texture_type.value} texture")
-                self.delete_material(material_id)
-                return None
+            for texture_type, texture_path in texture_paths.items():
+                if not self.add_texture(material_id, texture_path, texture_type):
+                    self.logger.error(f"Failed to add {texture_type.value} texture")
+                    self.delete_material(material_id)
+                    return None
 
         self.logger.info(f"Created material from images: {name}")
         return material_id
 
-    def _process_texture(self, texture_path: Path, texture_type: TextureType) -> Path:
+    def _process_texture(self, texture_path: Path, texture_type: TextureType,
+                         quality: Optional[int] = None) -> Tuple[Path, Tuple[int, int], str, str]:
         """
         Process and optimize a texture
 
         Args:
             texture_path: Input texture path
             texture_type: Type of texture
+            quality: JPEG quality (default 95 for normal maps, 85 otherwise)
 
         Returns:
-            Path to processed texture
+            (processed texture path, size, mode, format) of the output
         """
         # Create processed texture directory
         processed_dir = self.textures_dir / "processed"
         processed_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate output path
-        output_path = processed_dir / f"{texture_path.stem}_{texture_type.value}{texture_path.suffix}"
+        if quality is None:
+            quality = 95 if texture_type == TextureType.NORMAL else 85
 
         try:
             with Image.open(texture_path) as img:
                 # Convert to appropriate mode
                 if texture_type in [TextureType.ALBEDO, TextureType.EMISSION]:
                     # sRGB textures
-                    if img.mode != "RGB":
-                        img = img.convert("RGB")
+                    target_mode = "RGB"
+                else:
+                    # Linear textures (normal, roughness, metallic, etc.);
+                    # for normal maps with alpha, keep RGBA
+                    target_mode = "RGBA" if img.mode == "RGBA" else "RGB"
+
+                # Already in the target mode and a web format: copy the file
+                # instead of decoding and re-encoding it; otherwise the
+                # output format follows the suffix
+                passthrough = img.mode == target_mode and texture_path.suffix.lower() in _PASSTHROUGH_SUFFIXES
+                if passthrough:
+                    output_format = img.format or "UNKNOWN"
                 else:
-                    # Linear textures (normal, roughness, metallic, etc.)
-                    if img.mode == "RGBA":
-                        # For normal maps with alpha, keep RGBA
-                        pass
-                    elif img.mode != "RGB":
-                        img = img.convert("RGB")
+                    output_format = Image.registered_extensions().get(texture_path.suffix.lower(), "UNKNOWN")
+                texture_meta = (img.size, target_mode, output_format)
+
+                # Name the output by content and processing parameters so
+                # identical inputs are processed once
+                key = _texture_digest(texture_path, texture_type.value, target_mode, str(quality))
+                output_path = processed_dir / f"{key}{texture_path.suffix}"
+                if output_path.exists():
+                    return (output_path, *texture_meta)
+
+                if passthrough:
+                    if texture_path.parent == self.defaults_dir:
+                        # Generated defaults never change; share their inode
+                        _link_or_copy(texture_path, output_path)
+                    else:
+                        shutil.copy2(texture_path, output_path)
+                    return (output_path, *texture_meta)
+
+                if img.mode != target_mode:
+                    img = img.convert(target_mode)
 
                 # Save optimized texture
-                img.save(output_path, optimize=True, quality=95)
+                img.save(output_path, optimize=True, quality=quality)
 
-            return output_path
+            return (output_path, *texture_meta)
 
         except Exception as e:
             self.logger.error(f"Failed to process texture {texture_path}: {e}")
             raise
 
+    def _resized_texture_path(self, texture_path: Path, target_size: Tuple[int, int]) -> Path:
+        """Output path for a texture resized to target size"""
+        resized_dir = self.textures_dir / "resized"
+        resized_dir.mkdir(parents=True, exist_ok=True)
+
+        return resized_dir / f"{texture_path.stem}_{target_size[0]}x{target_size[1]}{texture_path.suffix}"
+
     def _resize_texture(self, texture_path: Path, target_size: Tuple[int, int]) -> Path:
         """
         Resize a texture to target size
@@ -453,18 +834,10 @@ class MaterialManager:
         Returns:
             Path to resized texture
         """
-        resized_dir = self.textures_dir / "resized"
-        resized_dir.mkdir(parents=True, exist_ok=True)
-
-        output_path = resized_dir / f"{texture_path.stem}_{target_size[0]}x{target_size[1]}{texture_path.suffix}"
+        output_path = self._resized_texture_path(texture_path, target_size)
 
         try:
-            with Image.open(texture_path) as img:
-                # Use LANCZOS for high-quality downsampling
-                resized_img = img.resize(target_size, Image.Resampling.LANCZOS)
-                resized_img.save(output_path, optimize=True, quality=95)
-
-            return output_path
+            return _resize_texture_file(texture_path, output_path, target_size)
 
         except Exception as e:
             self.logger.error(f"Failed to resize texture: {e}")
@@ -483,22 +856,46 @@ class MaterialManager:
         Returns:
             Path to generated texture
         """
-        default_dir = self.textures_dir / "defaults"
+        return self._generate_default_textures([(texture_type, color)], size)[0]
+
+    def _generate_default_textures(self, requests: List[Tuple[TextureType, Tuple[int, int, int]]],
+                                   size: Tuple[int, int]) -> List[Path]:
+        """
+        Generate default textures, reusing ones already generated
+
+        Args:
+            requests: (texture type, RGB color) pairs
+            size: Texture size (width, height)
+
+        Returns:
+            Paths to generated textures, in request order
+        """
+        default_dir = self.defaults_dir
         default_dir.mkdir(parents=True, exist_ok=True)
 
-        output_path = default_dir / f"default_{texture_type.value}_{size[0]}x{size[1]}.png"
+        keys = [(texture_type, tuple(size), tuple(color)) for texture_type, color in requests]
+        pending = []
+        for key in keys:
+            cached_path = self._default_cache.get(key)
+            if cached_path is None or not cached_path.exists():
+                # Color is part of the name so defaults of different colors don't collide
+                color_hex = "{:02x}{:02x}{:02x}".format(*key[2])
+                pending.append((key, default_dir /
+                                f"default_{key[0].value}_{size[0]}x{size[1]}_{color_hex}.png"))
 
         try:
-            # Create solid color image
-            img = Image.new("RGB", size, color)
-            img.save(output_path, optimize=True)
-
-            return output_path
+            _run_texture_jobs(_write_default_texture,
+                              [(output_path, size, key[2]) for key, output_path in pending])
 
         except Exception as e:
             self.logger.error(f"Failed to generate default texture: {e}")
             raise
 
+        for key, output_path in pending:
+            self._default_cache[key] = output_path
+
+        return [self._default_cache[key] for key in keys]
+
     def _get_texture_size(self, quality: MaterialQuality) -> Tuple[int, int]:
         """
         Get texture size for quality level
@@ -509,96 +906,169 @@ class MaterialManager:
         Returns:
             (width, height) tuple
         """
-        sizes = {
-            MaterialQuality.LOW: (512, 512),
-            MaterialQuality.MEDIUM: (1024, 1024),
-            MaterialQuality.HIGH: (2048, 2048),
-            MaterialQuality.ULTRA: (4096, 4096)
-        }
-        return sizes.get(quality, (1024, 1024))
+        return _QUALITY_SIZES.get(quality, (1024, 1024))
 
     def _get_timestamp(self) -> str:
-        """Get current timestamp"""
-        from datetime import datetime
-        return datetime.now().isoformat()
+        """Get current timestamp (refreshed at most once per second)"""
+        global _timestamp_cache
+        now = time.monotonic()
+        if _timestamp_cache is None or now - _timestamp_cache[0] >= _TIMESTAMP_REFRESH:
+            _timestamp_cache = (now, datetime.now().isoformat())
+        return _timestamp_cache[1]
 
     def _load_material_registry(self):
-        """Load material registry from disk"""
-        registry_path = self.materials_dir / "registry.json"
-        if not registry_path.exists():
-            return
+        """
+        Load material registry from disk
 
-        try:
-            with open(registry_path, "r") as f:
-                data = json.load(f)
-
-            for material_data in data.get("materials", []):
-                material = MaterialInfo(
-                    id=material_data["id"],
-                    name=material_data["name"],
-                    quality=MaterialQuality(material_data["quality"]),
-                    properties=material_data.get("properties", {}),
-                    created_at=material_data["created_at"],
-                    modified_at=material_data["modified_at"]
-                )
+        Tries the most recently written format first and falls back to the
+        other one if it cannot be read.
+
+        Raises:
+            RuntimeError: If the only registry present is msgpack and msgpack
+                is not installed (saving would otherwise overwrite it empty)
+        """
+        candidates = sorted(
+            (path for path in (self.materials_dir / "registry.mpk",
+                               self.materials_dir / "registry.json")
+             if path.exists()),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True
+        )
+
+        unreadable_mpk = None
+        for registry_path in candidates:
+            try:
+                if registry_path.suffix == ".mpk":
+                    if not MSGPACK_AVAILABLE:
+                        unreadable_mpk = registry_path
+                        self.logger.warning(f"msgpack not installed, cannot read {registry_path}")
+                        continue
+                    data = msgpack.unpackb(registry_path.read_bytes(), raw=False, strict_map_key=False)
+                    compact = True
+                else:
+                    data = _registry_loads(registry_path.read_bytes())
+                    compact = False
 
-                # Load texture info
-                for texture_type_str, texture_data in material_data.get("textures", {}).items():
-                    texture_type = TextureType(texture_type_str)
-                    texture_info = TextureInfo(
-                        path=Path(texture_data["path"]),
-                        type=texture_type,
-                        size=tuple(texture_data["size"]),
-                        channels=texture_data["channels"],
-                        format=texture_data["format"],
-                        is_srgb=texture_data.get("is_srgb", False)
-                    )
-                    material.textures[texture_type] = texture_info
-
-                self.materials[material.id] = material
+                materials = {}
+                for material_data in data.get("materials", []):
+                    material = self._material_from_record(material_data, compact)
+                    materials[material.id] = material
 
+            except Exception as e:
+                self.logger.error(f"Failed to load material registry {registry_path}: {e}")
+                continue
+
+            if registry_path != candidates[0]:
+                self.logger.warning(f"Loaded older registry {registry_path.name}; newer one was unreadable")
+            self.materials.update(materials)
             self.logger.info(f"Loaded {len(self.materials)} materials from registry")
+            return
 
-        except Exception as e:
-            self.logger.error(f"Failed to load material registry: {e}")
+        if unreadable_mpk is not None:
+            raise RuntimeError(
+                f"Material registry {unreadable_mpk} needs msgpack (pip install msgpack)"
+            )
 
     def _save_material_registry(self):
         """Save material registry to disk"""
-        registry_path = self.materials_dir / "registry.json"
+        registry_path = self.materials_dir / ("registry.mpk" if self._binary_registry else "registry.json")
 
         try:
-            data = {
-                "materials": []
-            }
-
-            for material in self.materials.values():
-                material_data = {
-                    "id": material.id,
-                    "name": material.name,
-                    "quality": material.quality.value,
-                    "properties": material.properties,
-                    "created_at": material.created_at,
-                    "modified_at": material.modified_at,
-                    "textures": {}
-                }
-
-                for texture_type, texture_info in material.textures.items():
-                    material_data["textures"][texture_type.value] = {
-                        "path": str(texture_info.path),
-                        "size": list(texture_info.size),
-                        "channels": texture_info.channels,
-                        "format": texture_info.format,
-                        "is_srgb": texture_info.is_srgb
-                    }
-
-                data["materials"].append(material_data)
-
-            with open(registry_path, "w") as f:
-                json.dump(data, f, indent=2)
+            # Stream one material at a time into a temporary file and swap it
+            # in, so neither the whole registry nor its encoding is held in
+            # memory and readers never see a partially written registry
+            tmp_path = registry_path.with_suffix(registry_path.suffix + ".tmp")
+            with open(tmp_path, "wb") as f:
+                if self._binary_registry:
+                    packer = msgpack.Packer(use_bin_type=True)
+                    f.write(packer.pack_map_header(1))
+                    f.write(packer.pack("materials"))
+                    f.write(packer.pack_array_header(len(self.materials)))
+                    for material in self.materials.values():
+                        f.write(packer.pack(self._material_record(material, compact=True)))
+                else:
+                    f.write(b'{"materials": [\n')
+                    for i, material in enumerate(self.materials.values()):
+                        if i:
+                            f.write(b",\n")
+                        f.write(_registry_dumps(self._material_record(material)))
+                    f.write(b"\n]}\n")
+            os.replace(tmp_path, registry_path)
+            self._dirty = False
 
         except Exception as e:
             self.logger.error(f"Failed to save material registry: {e}")
 
+    @staticmethod
+    def _material_record(material: MaterialInfo, compact: bool = False) -> Dict[str, Any]:
+        """
+        Registry entry for a material
+
+        Args:
+            material: Material to encode
+            compact: Encode enums as small-int codes (binary registry)
+
+        Returns:
+            Registry entry
+        """
+        material_data = {
+            "id": material.id,
+            "name": material.name,
+            "quality": _QUALITY_CODES[material.quality] if compact else material.quality.value,
+            "properties": material.properties,
+            "created_at": material.created_at,
+            "modified_at": material.modified_at,
+            "textures": {}
+        }
+
+        for texture_type, texture_info in material.textures.items():
+            key = _TEXTURE_TYPE_CODES[texture_type] if compact else texture_type.value
+            material_data["textures"][key] = {
+                "path": str(texture_info.path),
+                "size": list(texture_info.size),
+                "channels": texture_info.channels,
+                "format": texture_info.format,
+                "is_srgb": texture_info.is_srgb
+            }
+
+        return material_data
+
+    @staticmethod
+    def _material_from_record(material_data: Dict[str, Any], compact: bool = False) -> MaterialInfo:
+        """
+        Material from a registry entry
+
+        Args:
+            material_data: Registry entry
+            compact: Enums are small-int codes (binary registry)
+
+        Returns:
+            Decoded material
+        """
+        quality = material_data["quality"]
+        material = MaterialInfo(
+            id=material_data["id"],
+            name=material_data["name"],
+            quality=_QUALITIES_BY_CODE[quality] if compact else MaterialQuality(quality),
+            properties=material_data.get("properties", {}),
+            created_at=material_data["created_at"],
+            modified_at=material_data["modified_at"]
+        )
+
+        # Load texture info
+        for key, texture_data in material_data.get("textures", {}).items():
+            texture_type = _TEXTURE_TYPES_BY_CODE[key] if compact else TextureType(key)
+            material.textures[texture_type] = TextureInfo(
+                path=Path(texture_data["path"]),
+                type=texture_type,
+                size=tuple(texture_data["size"]),
+                channels=texture_data["channels"],
+                format=texture_data["format"],
+                is_srgb=texture_data.get("is_srgb", False)
+            )
+
+        return material
+
 
 # Blender integration functions
 class BlenderMaterialManager:
@@ -679,7 +1149,12 @@ class BlenderMaterialManager:
             TextureType.EMISSION: ("Emission", False),
         }
 
-        for texture_type, texture_info in material_info.textures.items():
+        # Image nodes by texture type; albedo goes first so AO can mix into it
+        created_nodes = {}
+        textures = sorted(material_info.textures.items(),
+                          key=lambda item: item[0] != TextureType.ALBEDO)
+
+        for texture_type, texture_info in textures:
             if texture_type not in texture_inputs:
                 continue
 
@@ -691,6 +1166,7 @@ class BlenderMaterialManager:
                 tex_node = nodes.new("ShaderNodeTexImage")
                 tex_node.location = (x_pos, y_pos)
                 tex_node.image = bpy.data.images.load(str(texture_info.path))
+                created_nodes[texture_type] = tex_node
 
                 # Set color space
                 if texture_info.is_srgb:
@@ -714,13 +1190,10 @@ class BlenderMaterialManager:
                         mix_node.inputs[0].default_value = 1.0
                         mix_node.location = (x_pos + 300, y_pos)
 
-                        # Find albedo node and connect
-                        for node in nodes:
-                            if (node.type == "TEX_IMAGE" and
-                                node.image and
-                                node.image.filepath.endswith(str(TextureType.ALBEDO.value))):
-                                links.new(node.outputs["Color"], mix_node.inputs[1])
-                                break
+                        # Connect the albedo node
+                        albedo_node = created_nodes.get(TextureType.ALBEDO)
+                        if albedo_node is not None:
+                            links.new(albedo_node.outputs["Color"], mix_node.inputs[1])
 
                         links.new(tex_node.outputs["Color"], mix_node.inputs[2])
                         links.new(mix_node.outputs["Color"], bsdf.inputs["Base Color"])
@@ -787,33 +1260,50 @@ def validate_material_textures(material_info: MaterialInfo) -> Dict[str, List[st
     Returns:
         Dictionary of texture types to list of issues
     """
-    issues = {}
+    return validate_all_materials([material_info]).get(material_info.id, {})
+
+
+def validate_all_materials(materials: List[MaterialInfo]) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Validate textures of many materials at once
+
+    Dimension checks run in one compiled pass over all texture sizes.
+
+    Args:
+        materials: Materials to validate
 
+    Returns:
+        Dictionary of material IDs to texture-type issues (materials
+        without issues are omitted)
+    """
     # Required textures for PBR
     required_textures = [TextureType.ALBEDO, TextureType.METALLIC, TextureType.ROUGHNESS]
 
-    for texture_type in required_textures:
-        type_issues = []
+    entries = [(material, texture_type, material.textures.get(texture_type))
+               for material in materials for texture_type in required_textures]
 
-        if texture_type not in material_info.textures:
-            type_issues.append("Missing required texture")
-        else:
-            texture_info = material_info.textures[texture_type]
+    sizes = np.array([texture_info.size if texture_info is not None else (0, 0)
+                      for _, _, texture_info in entries], dtype=np.int64).reshape(-1, 2)
+    missing = np.array([texture_info is None for _, _, texture_info in entries], dtype=np.bool_)
+    flags = size_flags(sizes, missing)
 
-            # Check if file exists
-            if not texture_info.path.exists():
+    file_count = len(entries) - int(missing.sum())
+    path_exists = _make_exists_checker() if file_count >= _LISTING_MIN_FILES else Path.exists
+    issues: Dict[str, Dict[str, List[str]]] = {}
+    for (material, texture_type, texture_info), flag in zip(entries, flags.tolist()):
+        if flag & MISSING:
+            type_issues = ["Missing required texture"]
+        else:
+            type_issues = []
+            if not path_exists(texture_info.path):
                 type_issues.append("Texture file not found")
-
-            # Check dimensions
-            if texture_info.size[0] != texture_info.size[1]:
+            if flag & NOT_SQUARE:
                 type_issues.append("Texture is not square")
-
-            # Check power of 2
-            if not (texture_info.size[0] & (texture_info.size[0] - 1) == 0):
+            if flag & NOT_POW2:
                 type_issues.append("Texture dimensions are not power of 2")
 
         if type_issues:
-            issues[texture_type.value] = type_issues
+            issues.setdefault(material.id, {})[texture_type.value] = type_issues
 
     return issues
 
@@ -835,14 +1325,15 @@ def create_procedural_material(material_manager: MaterialManager, name: str,
     Returns:
         Material ID
     """
-    material_id = material_manager.create_material(name)
+    with material_manager.batch():
+        material_id = material_manager.create_material(name)
 
-    # Set properties
-    material_manager.set_material_property(material_id, "base_color", base_color)
-    material_manager.set_material_property(material_id, "metallic", metallic)
-    material_manager.set_material_property(material_id, "roughness", roughness)
+        # Set properties
+        material_manager.set_material_property(material_id, "base_color", base_color)
+        material_manager.set_material_property(material_id, "metallic", metallic)
+        material_manager.set_material_property(material_id, "roughness", roughness)
 
-    # Generate default textures
-    material_manager.generate_missing_textures(material_id)
+        # Generate default textures
+        material_manager.generate_missing_textures(material_id)
 
     return material_id
\ No newline at end of file
@@ -4,11 +4,20 @@ Provides tools to normalize, validate, and standardize GLB files for
 consistent handling in the Holodeck system.
 """
 
+import asyncio
+import copy
+import functools
 import json
 import logging
-import subprocess
+import os
+import shutil
+import struct
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
+
+import numpy as np
 
 try:
     import trimesh
@@ -17,8 +26,184 @@ except ImportError:
     TRIMESH_AVAILABLE = False
     logging.warning("trimesh not available. Some GLB normalization features will be limited.")
 
+try:
+    import pyfqmr
+    PYFQMR_AVAILABLE = True
+except ImportError:
+    PYFQMR_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Binary glTF: 12-byte header (magic, version, length), then chunks of
+# (length, type, data) with the JSON chunk first
+_GLB_MAGIC = b"glTF"
+_GLB_JSON_CHUNK = b"JSON"
+_GLB_BIN_CHUNK = b"BIN\x00"
+
+# Validation/mesh-info reports kept per normalizer, keyed by file identity
+_REPORT_CACHE_SIZE = 128
+
+# glTF primitive modes that describe triangles: TRIANGLES, STRIP, FAN
+_GLTF_TRIANGLE_MODES = (4, 5, 6)
+
+
+def _read_glb_json(glb_path: Path) -> Optional[Dict[str, Any]]:
+    """Read the JSON chunk of a binary glTF file after checking its layout.
+
+    The header length must match the file size, and every bufferView stored
+    in the BIN chunk must lie inside it, so truncated downloads are rejected
+    without loading the mesh data.
+
+    Args:
+        glb_path: Path to GLB file
+
+    Returns:
+        Parsed glTF JSON, or None if the file is not a complete GLB or its
+        data cannot be checked here (e.g. external buffers)
+    """
+    try:
+        with open(glb_path, "rb") as f:
+            magic, _version, length = struct.unpack("<4sII", f.read(12))
+            if magic != _GLB_MAGIC or length != os.fstat(f.fileno()).st_size:
+                return None
+            chunk_length, chunk_type = struct.unpack("<I4s", f.read(8))
+            if chunk_type != _GLB_JSON_CHUNK or 20 + chunk_length > length:
+                return None
+            gltf = json.loads(f.read(chunk_length))
+
+            bin_length = None
+            if 20 + chunk_length + 8 <= length:
+                bin_length, bin_type = struct.unpack("<I4s", f.read(8))
+                if bin_type != _GLB_BIN_CHUNK or 28 + chunk_length + bin_length > length:
+                    return None
+    except (OSError, struct.error, ValueError):
+        return None
+
+    try:
+        buffers = gltf.get("buffers", [])
+        for view in gltf.get("bufferViews", []):
+            buffer = buffers[view["buffer"]]
+            if "uri" in buffer or bin_length is None:
+                return None
+            if view.get("byteOffset", 0) + view["byteLength"] > bin_length:
+                return None
+    except (AttributeError, KeyError, IndexError, TypeError):
+        return None
+    return gltf
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """os.stat() of a file, or None if it cannot be read."""
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def _load_glb(path: Path, process: bool = True):
+    """trimesh.load() that goes straight to the GLB loader for .glb paths."""
+    file_type = "glb" if path.suffix.lower() == ".glb" else None
+    return trimesh.load(str(path), file_type=file_type, process=process)
+
+
+@functools.lru_cache(maxsize=1)
+def _cube_glb_template() -> Tuple[Dict[str, Any], bytes]:
+    """Unit cube GLB exported once by trimesh, split into (JSON, binary chunk)."""
+    data = trimesh.creation.box(extents=[1.0, 1.0, 1.0]).export(file_type="glb")
+    json_length = struct.unpack("<I", data[12:16])[0]
+    bin_start = 20 + json_length
+    bin_length = struct.unpack("<I", data[bin_start:bin_start + 4])[0]
+    return json.loads(data[20:bin_start]), data[bin_start + 8:bin_start + 8 + bin_length]
+
+
+def _cube_glb_bytes(size_m: float) -> bytes:
+    """GLB bytes for a cube, scaled from the cached unit cube template.
+
+    Args:
+        size_m: Cube size in meters
+
+    Returns:
+        GLB file contents
+    """
+    template_json, template_bin = _cube_glb_template()
+    gltf = copy.deepcopy(template_json)
+    binary = bytearray(template_bin)
+
+    # Scale POSITION data in place, and its accessor bounds to match
+    for mesh in gltf["meshes"]:
+        if "extents" in mesh.get("extras", {}):
+            mesh["extras"]["extents"] = [size_m] * 3
+        for primitive in mesh["primitives"]:
+            accessor = gltf["accessors"][primitive["attributes"]["POSITION"]]
+            view = gltf["bufferViews"][accessor["bufferView"]]
+            offset = view.get("byteOffset", 0) + accessor.get("byteOffset", 0)
+            positions = np.frombuffer(binary, dtype=np.float32, count=accessor["count"] * 3, offset=offset)
+            positions *= size_m
+            accessor["min"] = [v * size_m for v in accessor["min"]]
+            accessor["max"] = [v * size_m for v in accessor["max"]]
+
+    # Chunks are 4-byte aligned: JSON padded with spaces, binary with zeros
+    json_chunk = json.dumps(gltf, separators=(",", ":")).encode("utf-8")
+    json_chunk += b" " * (-len(json_chunk) % 4)
+    binary += b"\0" * (-len(binary) % 4)
+    total_length = 12 + 8 + len(json_chunk) + 8 + len(binary)
+    return b"".join((
+        struct.pack("<4sII", _GLB_MAGIC, 2, total_length),
+        struct.pack("<I4s", len(json_chunk), _GLB_JSON_CHUNK), json_chunk,
+        struct.pack("<I4s", len(binary), b"BIN\0"), bytes(binary),
+    ))
+
+
+def _sum_lengths(geometries: Tuple[Any, ...], attribute: str) -> int:
+    """Total length of an array attribute over geometries that have it."""
+    return sum(
+        len(value) for value in (getattr(g, attribute, None) for g in geometries)
+        if value is not None
+    )
+
+
+def _sum_scalars(geometries: Tuple[Any, ...], attribute: str) -> float:
+    """Total of a numeric attribute over geometries that have it."""
+    return sum(
+        (value for value in (getattr(g, attribute, None) for g in geometries)
+         if hasattr(value, '__float__')),
+        0.0
+    )
+
+
+def _count_gltf_geometry(gltf: Dict[str, Any]) -> Tuple[int, int]:
+    """Count vertices and triangles from glTF accessor metadata.
+
+    Args:
+        gltf: Parsed glTF JSON
+
+    Returns:
+        Tuple of (vertex_count, triangle_count)
+    """
+    accessors = gltf.get("accessors", [])
+    vertex_count = 0
+    triangle_count = 0
+    for mesh in gltf.get("meshes", []):
+        for primitive in mesh.get("primitives", []):
+            position = primitive.get("attributes", {}).get("POSITION")
+            if position is None:
+                continue
+            vertices = accessors[position]["count"]
+            vertex_count += vertices
+
+            mode = primitive.get("mode", 4)
+            if mode not in _GLTF_TRIANGLE_MODES:
+                continue
+            indices = primitive.get("indices")
+            elements = accessors[indices]["count"] if indices is not None else vertices
+            triangle_count += elements // 3 if mode == 4 else max(elements - 2, 0)
+    return vertex_count, triangle_count
+
+
+def _normalize_one_path(glb_path: Path, kwargs: Dict[str, Any]) -> Tuple[Path, Dict[str, Any]]:
+    """Normalize one GLB (module-level so worker processes can run it)."""
+    return GLBNormalizer().normalize_asset(glb_path, **kwargs)
+
 
 class GLBNormalizer:
     """GLB归一化工具 - Normalizes GLB files for consistent handling."""
@@ -26,17 +211,72 @@ class GLBNormalizer:
     def __init__(self):
         """Initialize GLB normalizer."""
         self.trimesh_available = TRIMESH_AVAILABLE
-
-    def validate_glb(self, glb_path: Path) -> Dict[str, Any]:
+        self._report_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+
+    @staticmethod
+    def _report_key(kind: str, glb_path: Path, stat: Optional[os.stat_result]) -> Optional[Tuple]:
+        """Cache key for a report on a file, or None if the file is missing."""
+        if stat is None:
+            return None
+        return kind, str(glb_path), stat.st_mtime_ns, stat.st_size
+
+    def _cached_report(self, key: Optional[Tuple]) -> Optional[Dict[str, Any]]:
+        """Copy of a cached report, or None on a miss."""
+        if key is None or key not in self._report_cache:
+            return None
+        self._report_cache.move_to_end(key)
+        return copy.deepcopy(self._report_cache[key])
+
+    def _store_report(self, key: Optional[Tuple], report: Dict[str, Any]):
+        """Cache a copy of a report, evicting the least recently used."""
+        if key is None:
+            return
+        self._report_cache[key] = copy.deepcopy(report)
+        self._report_cache.move_to_end(key)
+        while len(self._report_cache) > _REPORT_CACHE_SIZE:
+            self._report_cache.popitem(last=False)
+
+    def validate_glb(self, glb_path: Path, deep: bool = False) -> Dict[str, Any]:
         """Validate GLB file structure and extract basic metadata.
 
         Args:
             glb_path: Path to GLB file
+            deep: Load the full scene with trimesh's default processing
+                instead of reading counts from the file's metadata
 
         Returns:
             Validation report dictionary
         """
         glb_path = Path(glb_path)
+        stat = _stat_or_none(glb_path)
+        key = self._report_key("validate_deep" if deep else "validate", glb_path, stat)
+        cached = self._cached_report(key)
+        if cached is not None:
+            return cached
+
+        validation_report, _ = self._validate_scene(glb_path, count_only=not deep, stat=stat)
+        self._store_report(key, validation_report)
+        return validation_report
+
+    def _validate_scene(
+        self,
+        glb_path: Path,
+        scene: Optional[Any] = None,
+        count_only: bool = False,
+        stat: Optional[os.stat_result] = None
+    ) -> Tuple[Dict[str, Any], Optional[Any]]:
+        """Validate a GLB file, loading it with trimesh unless a scene is given.
+
+        Args:
+            glb_path: Path to GLB file
+            scene: Already loaded trimesh scene for glb_path
+            count_only: Take counts from the GLB JSON chunk when possible,
+                otherwise load the scene without mesh processing
+            stat: os.stat() result already taken for glb_path
+
+        Returns:
+            Tuple of (validation report, loaded scene or None)
+        """
         validation_report = {
             "is_valid": False,
             "file_size_mb": 0,
@@ -47,35 +287,53 @@ class GLBNormalizer:
             "warnings": []
         }
 
-        if not glb_path.exists():
+        if stat is None:
+            stat = _stat_or_none(glb_path)
+        if stat is None:
             validation_report["errors"].append(f"GLB file not found: {glb_path}")
-            return validation_report
+            return validation_report, None
 
         # Check file size
-        file_size_mb = glb_path.stat().st_size / (1024 * 1024)
+        file_size_mb = stat.st_size / (1024 * 1024)
         validation_report["file_size_mb"] = round(file_size_mb, 2)
 
         if file_size_mb > 100:  # Warning for large files
             validation_report["warnings"].append(f"Large file size: {file_size_mb:.1f}MB")
 
+        # Counts and material totals are recorded in the JSON chunk
+        gltf = _read_glb_json(glb_path) if count_only and scene is None else None
+        if gltf is not None:
+            try:
+                vertex_count, triangle_count = _count_gltf_geometry(gltf)
+            except (KeyError, IndexError, TypeError) as e:
+                validation_report["errors"].append(f"Invalid glTF accessors: {e}")
+                return validation_report, None
+
+            if not gltf.get("meshes"):
+                validation_report["errors"].append("No geometry found in GLB")
+                return validation_report, None
+
+            validation_report["vertex_count"] = vertex_count
+            validation_report["triangle_count"] = triangle_count
+            validation_report["materials"] = len(gltf.get("materials", []))
+            validation_report["is_valid"] = True
+            return validation_report, None
+
         if self.trimesh_available:
             try:
                 # Load and analyze mesh
-                scene = trimesh.load(str(glb_path))
+                if scene is None:
+                    # Counting needs no vertex merging or normals
+                    scene = _load_glb(glb_path, process=not count_only)
 
                 if hasattr(scene, 'geometry'):
                     # Count vertices and triangles
-                    for name, geometry in scene.geometry.items():
-                        if hasattr(geometry, 'vertices'):
-                            validation_report["vertex_count"] += len(geometry.vertices)
-                        if hasattr(geometry, 'faces'):
-                            validation_report["triangle_count"] += len(geometry.faces)
+                    geometries = tuple(scene.geometry.values())
+                    validation_report["vertex_count"] = _sum_lengths(geometries, 'vertices')
+                    validation_report["triangle_count"] = _sum_lengths(geometries, 'faces')
 
                     validation_report["is_valid"] = True
-                    validation_report["materials"] = len(set(
-                        g.visual.material for g in scene.geometry.values()
-                        if hasattr(g, 'visual') and g.visual.material is not None
-                    ))
+                    validation_report["materials"] = self._count_materials(scene)
                 else:
                     validation_report["errors"].append("No geometry found in GLB")
 
@@ -86,7 +344,7 @@ class GLBNormalizer:
             validation_report["warnings"].append("trimesh not available - limited validation")
             validation_report["is_valid"] = True  # Basic check that file exists
 
-        return validation_report
+        return validation_report, scene
 
     def normalize_asset(
         self,
@@ -110,8 +368,9 @@ class GLBNormalizer:
         """
         glb_path = Path(glb_path)
 
-        # Validate input file
-        validation = self.validate_glb(glb_path)
+        # Validate input file; the loaded scene is reused for processing.
+        # Without trimesh, counts come from the GLB JSON chunk
+        validation, scene = self._validate_scene(glb_path, count_only=not self.trimesh_available)
         if not validation["is_valid"]:
             raise ValueError(f"Invalid GLB file: {validation['errors']}")
 
@@ -129,33 +388,42 @@ class GLBNormalizer:
             "operations_applied": []
         }
 
+        # A copied output matches the validated input
+        output_validation = validation
+
         if self.trimesh_available:
             # Use trimesh for detailed processing
             processed_scene = self._process_with_trimesh(
                 glb_path, target_size_m, pivot_adjustment, max_vertex_count,
-                normalization_metadata
+                normalization_metadata, preloaded_scene=scene
             )
 
             # Export normalized GLB
             try:
                 processed_scene.export(str(output_path))
                 normalization_metadata["operations_applied"].append("trimesh_export")
-                logger.info(f"Successfully normalized GLB: {glb_path} -> {output_path}")
+                logger.info("Successfully normalized GLB: %s -> %s", glb_path, output_path)
+
+                # The exported scene is in memory; only the file size is new
+                file_size_mb = output_path.stat().st_size / (1024 * 1024)
+                output_validation = {
+                    "vertex_count": _sum_lengths(tuple(processed_scene.geometry.values()), 'vertices'),
+                    "file_size_mb": round(file_size_mb, 2),
+                    "is_valid": True,
+                    "errors": [],
+                    "warnings": [f"Large file size: {file_size_mb:.1f}MB"] if file_size_mb > 100 else []
+                }
             except Exception as e:
                 # Fallback: copy original file
-                import shutil
                 shutil.copy2(glb_path, output_path)
                 normalization_metadata["operations_applied"].append("fallback_copy")
-                logger.warning(f"Failed to export with trimesh, copied original: {e}")
+                logger.warning("Failed to export with trimesh, copied original: %s", e)
         else:
             # Fallback: just copy the file
-            import shutil
             shutil.copy2(glb_path, output_path)
             normalization_metadata["operations_applied"].append("simple_copy_no_trimesh")
             logger.warning("trimesh not available - copying original file without normalization")
 
-        # Validate output
-        output_validation = self.validate_glb(output_path)
         normalization_metadata.update({
             "final_vertex_count": output_validation["vertex_count"],
             "final_size_mb": output_validation["file_size_mb"],
@@ -166,13 +434,39 @@ class GLBNormalizer:
 
         return output_path, normalization_metadata
 
+    def normalize_assets(self, glb_paths: List[Path], **kwargs) -> List[Tuple[Path, Dict[str, Any]]]:
+        """Normalize many GLB assets in parallel worker processes.
+
+        Args:
+            glb_paths: Input GLB file paths
+            **kwargs: normalize_asset arguments other than output_path,
+                applied to every file
+
+        Returns:
+            List of (normalized_path, normalization_metadata) in input order
+
+        Raises:
+            ValueError: If any input GLB is invalid
+        """
+        glb_paths = [Path(glb_path) for glb_path in glb_paths]
+        if len(glb_paths) <= 1:
+            return [self.normalize_asset(glb_path, **kwargs) for glb_path in glb_paths]
+
+        workers = min(len(glb_paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(
+                _normalize_one_path, glb_paths, [kwargs] * len(glb_paths),
+                chunksize=max(1, len(glb_paths) // (4 * workers))
+            ))
+
     def _process_with_trimesh(
         self,
         glb_path: Path,
         target_size_m: Optional[Tuple[float, float, float]],
         pivot_adjustment: Optional[Tuple[float, float, float]],
         max_vertex_count: int,
-        metadata: Dict[str, Any]
+        metadata: Dict[str, Any],
+        preloaded_scene: Optional[Any] = None
     ):
         """Process GLB using trimesh for detailed normalization.
 
@@ -182,79 +476,144 @@ class GLBNormalizer:
             pivot_adjustment: Pivot adjustment
             max_vertex_count: Max vertex count
             metadata: Metadata dict to update
+            preloaded_scene: Scene already loaded from glb_path (modified in place)
 
         Returns:
             Processed trimesh scene
         """
-        scene = trimesh.load(str(glb_path))
+        scene = preloaded_scene if preloaded_scene is not None else _load_glb(glb_path)
 
         # Combine all geometries into single mesh if needed
         if hasattr(scene, 'geometry') and len(scene.geometry) > 1:
             meshes = list(scene.geometry.values())
-            combined_mesh = trimesh.util.concatenate(meshes)
+            # Decimation discards materials and UVs, so meshes headed for it
+            # only need their geometry stacked
+            if (all(isinstance(m, trimesh.Trimesh) for m in meshes)
+                    and sum(len(m.vertices) for m in meshes) > max_vertex_count):
+                combined_mesh = self._fast_concat(meshes)
+            else:
+                combined_mesh = trimesh.util.concatenate(meshes)
             scene.geometry.clear()
             scene.geometry["combined"] = combined_mesh
             metadata["operations_applied"].append("combine_meshes")
 
         # Get the main mesh
         if hasattr(scene, 'geometry') and scene.geometry:
-            mesh = list(scene.geometry.values())[0]
+            mesh = next(iter(scene.geometry.values()))
         else:
             raise ValueError("No mesh geometry found in GLB")
 
-        original_size_mb = glb_path.stat().st_size / (1024 * 1024)
-
         # 1. Vertex count reduction if needed
         if len(mesh.vertices) > max_vertex_count:
             ratio = max_vertex_count / len(mesh.vertices)
-            simplified = mesh.simplify_quadric_decimation(
-                face_count=int(len(mesh.faces) * ratio)
-            )
+            simplified = self._simplify_mesh(mesh, int(len(mesh.faces) * ratio))
             scene.geometry.clear()
             scene.geometry["simplified"] = simplified
             metadata["operations_applied"].append(f"vertex_reduce_{max_vertex_count}")
-            logger.info(f"Reduced vertices from {len(mesh.vertices)} to {len(simplified.vertices)}")
+            logger.info("Reduced vertices from %d to %d", len(mesh.vertices), len(simplified.vertices))
 
         # Refresh mesh reference
-        mesh = list(scene.geometry.values())[0]
-
-        # 2. Size normalization
-        if target_size_m:
-            # Get current bounds
-            bounds = mesh.bounds
-            if bounds is not None:
-                current_size = bounds[1] - bounds[0]  # Size in each dimension
-
+        mesh = next(iter(scene.geometry.values()))
+
+        # Size normalization and pivot adjustment are both taken from the
+        # current bounds and applied as one update of the vertex array
+        bounds = mesh.bounds
+        if bounds is not None and (target_size_m or pivot_adjustment):
+            min_bound, max_bound = bounds
+            current_size = max_bound - min_bound  # Size in each dimension
+            scale = 1.0
+            target_origin = np.zeros(3)
+
+            # 2. Size normalization
+            if target_size_m:
                 # Calculate scale factors
-                scale_factors = []
-                for i, target_dim in enumerate(target_size_m):
-                    if current_size[i] > 0 and target_dim > 0:
-                        scale_factor = target_dim / current_size[i]
-                        scale_factors.append(scale_factor)
+                scale_factors = [
+                    target_dim / current_size[i]
+                    for i, target_dim in enumerate(target_size_m)
+                    if current_size[i] > 0 and target_dim > 0
+                ]
 
                 if scale_factors:
-                    # Apply uniform scaling if needed
-                    scale_factors = [min(scale_factors)] * 3  # Uniform scaling
-                    mesh.apply_scale(scale_factors)
-                    metadata["operations_applied"].append(f"scale_{scale_factors[0]:.3f}")
-                    logger.info(f"Scaled mesh by {scale_factors[0]:.3f}")
-
-        # 3. Pivot point adjustment
-        if pivot_adjustment:
-            bounds = mesh.bounds
-            if bounds is not None:
-                # Calculate desired origin based on pivot adjustment (0-1 normalized)
-                min_bound, max_bound = bounds
-                target_origin = min_bound + (max_bound - min_bound) * pivot_adjustment
+                    scale = min(scale_factors)  # Uniform scaling
+                    metadata["operations_applied"].append(f"scale_{scale:.3f}")
+                    logger.info("Scaled mesh by %.3f", scale)
 
-                # Apply transformation to move mesh
-                transform = trimesh.transformations.translation_matrix(-target_origin)
-                mesh.apply_transform(transform)
+            # 3. Pivot point adjustment
+            if pivot_adjustment:
+                # Calculate desired origin based on pivot adjustment (0-1 normalized)
+                target_origin = min_bound + current_size * np.asarray(pivot_adjustment)
                 metadata["operations_applied"].append(f"pivot_{pivot_adjustment}")
-                logger.info(f"Adjusted pivot to {target_origin}")
+                logger.info("Adjusted pivot to %s", target_origin * scale)
+
+            # Translate then scale in a single pass
+            mesh.vertices = (mesh.vertices - target_origin) * scale
 
         return scene
 
+    @staticmethod
+    def _count_materials(scene) -> int:
+        """Count distinct materials in a scene.
+
+        Materials are deduplicated by identity: a scene reuses the same
+        material object, and hashing trimesh materials serializes them.
+
+        Args:
+            scene: trimesh scene
+
+        Returns:
+            Number of distinct materials
+        """
+        return len({
+            id(material) for material in (
+                getattr(getattr(g, 'visual', None), 'material', None)
+                for g in scene.geometry.values()
+            )
+            if material is not None
+        })
+
+    @staticmethod
+    def _fast_concat(meshes):
+        """Combine meshes by stacking vertex and face arrays.
+
+        Unlike trimesh.util.concatenate, visuals are not merged.
+
+        Args:
+            meshes: trimesh meshes to combine
+
+        Returns:
+            Combined trimesh mesh
+        """
+        offsets = np.cumsum([0] + [len(m.vertices) for m in meshes[:-1]])
+        return trimesh.Trimesh(
+            vertices=np.vstack([m.vertices for m in meshes]),
+            faces=np.vstack([m.faces + offset for m, offset in zip(meshes, offsets)]),
+            process=False
+        )
+
+    def _simplify_mesh(self, mesh, face_count: int):
+        """Decimate a mesh to about face_count triangles.
+
+        Uses pyfqmr (Fast-Quadric-Mesh-Reduction) when installed and trimesh's
+        quadric decimation otherwise.
+
+        Args:
+            mesh: trimesh mesh to simplify
+            face_count: Target triangle count
+
+        Returns:
+            Simplified trimesh mesh
+        """
+        if not PYFQMR_AVAILABLE:
+            return mesh.simplify_quadric_decimation(face_count=face_count)
+
+        simplifier = pyfqmr.Simplify()
+        simplifier.setMesh(mesh.vertices, mesh.faces)
+        simplifier.simplify_mesh(
+            target_count=face_count, aggressiveness=7, preserve_border=True, verbose=False
+        )
+        vertices, faces, _ = simplifier.getMesh()
+        return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+
     def extract_mesh_info(self, glb_path: Path) -> Dict[str, Any]:
         """Extract detailed mesh information from GLB file.
 
@@ -279,40 +638,42 @@ class GLBNormalizer:
             "surface_area": 0.0
         }
 
-        if not glb_path.exists():
+        stat = _stat_or_none(glb_path)
+        if stat is None:
             return mesh_info
 
-        mesh_info["file_size_mb"] = round(glb_path.stat().st_size / (1024 * 1024), 2)
+        key = self._report_key("mesh_info", glb_path, stat)
+        cached = self._cached_report(key)
+        if cached is not None:
+            return cached
+
+        mesh_info["file_size_mb"] = round(stat.st_size / (1024 * 1024), 2)
 
         if self.trimesh_available:
             try:
-                scene = trimesh.load(str(glb_path))
+                scene = _load_glb(glb_path)
 
                 if hasattr(scene, 'geometry'):
-                    for name, geometry in scene.geometry.items():
-                        if hasattr(geometry, 'vertices'):
-                            mesh_info["vertex_count"] += len(geometry.vertices)
-                        if hasattr(geometry, 'faces'):
-                            mesh_info["triangle_count"] += len(geometry.faces)
-                        if hasattr(geometry, 'edges'):
-                            mesh_info["edge_count"] += len(geometry.edges)
-                        if hasattr(geometry, 'mass'):
-                            mesh_info["volume"] += geometry.mass if hasattr(geometry.mass, '__float__') else 0.0
-                        if hasattr(geometry, 'area'):
-                            mesh_info["surface_area"] += geometry.area if hasattr(geometry.area, '__float__') else 0.0
-                        if hasattr(geometry, 'visual') and geometry.visual.material:
-                            mesh_info["materials"] += 1
+                    geometries = tuple(scene.geometry.values())
+                    mesh_info["vertex_count"] = _sum_lengths(geometries, 'vertices')
+                    mesh_info["triangle_count"] = _sum_lengths(geometries, 'faces')
+                    mesh_info["edge_count"] = _sum_lengths(geometries, 'edges')
+                    mesh_info["volume"] = _sum_scalars(geometries, 'mass')
+                    mesh_info["surface_area"] = _sum_scalars(geometries, 'area')
+
+                    mesh_info["materials"] = self._count_materials(scene)
 
                     # Get bounds and center for primary mesh
                     if scene.geometry:
-                        primary_mesh = list(scene.geometry.values())[0]
+                        primary_mesh = next(iter(scene.geometry.values()))
                         if hasattr(primary_mesh, 'bounds') and primary_mesh.bounds is not None:
                             mesh_info["bounds"] = primary_mesh.bounds.tolist()
                             mesh_info["center"] = primary_mesh.centroid.tolist()
 
             except Exception as e:
-                logger.error(f"Failed to extract mesh info from {glb_path}: {e}")
+                logger.error("Failed to extract mesh info from %s: %s", glb_path, e)
 
+        self._store_report(key, mesh_info)
         return mesh_info
 
     def create_placeholder_cube(self, size_m: float = 1.0, output_path: Optional[Path] = None) -> Path:
@@ -326,20 +687,54 @@ class GLBNormalizer:
             Path to created placeholder GLB
         """
         if self.trimesh_available:
-            # Create cube with trimesh
-            cube = trimesh.creation.box(extents=[size_m, size_m, size_m])
-
             if output_path is None:
-                output_path = Path.cwd() / "workspace" / "temp" / f"placeholder_{size_m}m_cube.glb"
+                output_path = self._placeholder_path(size_m)
 
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            cube.export(str(output_path))
-            logger.info(f"Created placeholder cube: {output_path}")
+            if size_m > 0:
+                # Scale the cached unit cube instead of running the exporter
+                output_path.write_bytes(_cube_glb_bytes(size_m))
+            else:
+                # Create cube with trimesh
+                cube = trimesh.creation.box(extents=[size_m, size_m, size_m])
+                cube.export(str(output_path))
+            logger.info("Created placeholder cube: %s", output_path)
             return output_path
         else:
             # Fallback: Create placeholder using Blender (if available)
             return self._create_placeholder_with_blender(size_m, output_path)
 
+    def create_placeholder_cubes(
+        self,
+        sizes_m: List[float],
+        output_paths: Optional[List[Optional[Path]]] = None
+    ) -> List[Path]:
+        """Create several placeholder cube GLBs.
+
+        Without trimesh, all cubes are built in a single Blender run.
+
+        Args:
+            sizes_m: Cube sizes in meters
+            output_paths: Output paths (auto-generated where None)
+
+        Returns:
+            Paths to created placeholder GLBs
+        """
+        if output_paths is None:
+            output_paths = [None] * len(sizes_m)
+
+        if self.trimesh_available:
+            return [
+                self.create_placeholder_cube(size_m, output_path)
+                for size_m, output_path in zip(sizes_m, output_paths)
+            ]
+        return self._create_placeholders_with_blender(sizes_m, output_paths)
+
+    @staticmethod
+    def _placeholder_path(size_m: float) -> Path:
+        """Default output path for a placeholder cube."""
+        return Path.cwd() / "workspace" / "temp" / f"placeholder_{size_m}m_cube.glb"
+
     def _create_placeholder_with_blender(self, size_m: float, output_path: Optional[Path]) -> Path:
         """Create placeholder using Blender as fallback.
 
@@ -350,51 +745,138 @@ class GLBNormalizer:
         Returns:
             Path to created placeholder
         """
-        if output_path is None:
-            output_path = Path.cwd() / "workspace" / "temp" / f"placeholder_{size_m}m_cube.glb"
+        return self._create_placeholders_with_blender([size_m], [output_path])[0]
+
+    def _create_placeholders_with_blender(
+        self,
+        sizes_m: List[float],
+        output_paths: List[Optional[Path]]
+    ) -> List[Path]:
+        """Create placeholders in one Blender run as fallback.
+
+        Args:
+            sizes_m: Cube sizes in meters
+            output_paths: Output paths (auto-generated where None)
+
+        Returns:
+            Paths to created placeholders
+        """
+        coro = self._create_placeholders_with_blender_async(sizes_m, output_paths)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        # Called from inside an event loop: run on a separate thread's loop
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, coro).result()
+
+    async def create_placeholder_cube_async(
+        self,
+        size_m: float = 1.0,
+        output_path: Optional[Path] = None
+    ) -> Path:
+        """Async version of create_placeholder_cube.
+
+        Blender fallbacks run as subprocesses without blocking the event
+        loop, so several placeholders can be built concurrently.
+
+        Args:
+            size_m: Cube size in meters
+            output_path: Output path (auto-generated if None)
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        Returns:
+            Path to created placeholder GLB
+        """
+        if self.trimesh_available:
+            return await asyncio.to_thread(self.create_placeholder_cube, size_m, output_path)
+        return await self._create_placeholder_with_blender_async(size_m, output_path)
+
+    async def _create_placeholder_with_blender_async(self, size_m: float, output_path: Optional[Path]) -> Path:
+        """Create placeholder using an async Blender subprocess.
+
+        Args:
+            size_m: Cube size in meters
+            output_path: Output path
+
+        Returns:
+            Path to created placeholder
+        """
+        paths = await self._create_placeholders_with_blender_async([size_m], [output_path])
+        return paths[0]
+
+    async def _create_placeholders_with_blender_async(
+        self,
+        sizes_m: List[float],
+        output_paths: List[Optional[Path]]
+    ) -> List[Path]:
+        """Create placeholders in one async Blender subprocess.
+
+        Args:
+            sizes_m: Cube sizes in meters
+            output_paths: Output paths (auto-generated where None)
+
+        Returns:
+            Paths to created placeholders
+        """
+        output_paths = [
+            output_path if output_path is not None else self._placeholder_path(size_m)
+            for size_m, output_path in zip(sizes_m, output_paths)
+        ]
+        for output_path in output_paths:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Try to use Blender if available
         try:
+            cubes = [(size_m, str(output_path)) for size_m, output_path in zip(sizes_m, output_paths)]
             blender_script = f"""
 import bpy
 import math
 
-# Clear existing objects
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
+for size, filepath in {cubes!r}:
+    # Clear existing objects
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete(use_global=False)
 
-# Create cube
-bpy.ops.mesh.primitive_cube_add(size={size_m})
-cube = bpy.context.active_object
+    # Create cube
+    bpy.ops.mesh.primitive_cube_add(size=size)
+    cube = bpy.context.active_object
 
-# Apply default material
-bpy.ops.material.new()
-mat = bpy.data.materials["Material"]
-cube.data.materials.append(mat)
+    # Apply default material
+    bpy.ops.material.new()
+    mat = bpy.data.materials["Material"]
+    cube.data.materials.append(mat)
 
-# Export as GLB
-bpy.ops.export_scene.gltf(filepath="{output_path}")
+    # Export as GLB
+    bpy.ops.export_scene.gltf(filepath=filepath)
 """
 
-            # Run Blender with script
-            result = subprocess.run(
-                ["blender", "--background", "--python-expr", blender_script],
-                capture_output=True,
-                text=True,
-                timeout=30
+            # Run Blender with script; skip user preferences, add-ons,
+            # auto-run scripts and audio for a faster startup
+            process = await asyncio.create_subprocess_exec(
+                "blender", "--background", "--factory-startup", "--disable-autoexec",
+                "-noaudio", "--python-expr", blender_script,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
-
-            if result.returncode == 0:
-                logger.info(f"Created placeholder cube with Blender: {output_path}")
-                return output_path
+            try:
+                _, stderr = await asyncio.wait_for(process.communicate(), timeout=30)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise Exception("Blender timed out after 30s")
+
+            if process.returncode == 0:
+                for output_path in output_paths:
+                    logger.info("Created placeholder cube with Blender: %s", output_path)
+                return output_paths
             else:
-                raise Exception(f"Blender error: {result.stderr}")
+                raise Exception(f"Blender error: {stderr.decode(errors='replace')}")
 
         except Exception as e:
-            logger.error(f"Failed to create placeholder with Blender: {e}")
+            logger.error("Failed to create placeholder with Blender: %s", e)
             # Last resort: create empty file as placeholder
-            output_path.write_bytes(b'')
-            logger.warning(f"Created empty placeholder file: {output_path}")
-            return output_path
\ No newline at end of file
+            for output_path in output_paths:
+                output_path.write_bytes(b'')
+                logger.warning("Created empty placeholder file: %s", output_path)
+            return output_paths
@@ -17,6 +17,16 @@ from typing import Dict, List, Optional, Tuple, Any
 
 from ..image_generation.comfyui_client import ComfyUIClient
 
+try:
+    import orjson
+    _template_dumps = orjson.dumps
+    _template_loads = orjson.loads
+except ImportError:
+    def _template_dumps(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    _template_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,6 +63,9 @@ class SF3DClient(ComfyUIClient):
         if not self.sf3d_workflow_template:
             raise ValueError(f"Failed to load SF3D workflow template from {sf3d_workflow_template_path}")
 
+        # Serialized once; each build parses a fresh copy from these bytes
+        self._template_blob = _template_dumps(self.sf3d_workflow_template)
+
     def _load_workflow_template(self, template_path: str) -> Dict[str, Any]:
         """Load SF3D workflow template from JSON file.
 
@@ -108,7 +121,7 @@ class SF3DClient(ComfyUIClient):
         import uuid
 
         # Create a deep copy of the template
-        workflow = json.loads(json.dumps(self.sf3d_workflow_template))
+        workflow = _template_loads(self._template_blob)
 
         # Determine the image filename to use in workflow
         if use_prepared_image:
@@ -218,6 +231,57 @@ class SF3DClient(ComfyUIClient):
         except Exception as e:
             raise Exception(f"Failed to upload image to ComfyUI: {e}")
 
+    def _connect_websocket(self) -> Optional[websocket.WebSocket]:
+        """Open the ComfyUI WebSocket for this client.
+
+        Returns:
+            Connected WebSocket, or None if the server could not be reached
+        """
+        ws_url = f"ws://{self.server_address}/ws?clientId={self.client_id}"
+        ws = websocket.WebSocket()
+        try:
+            ws.connect(ws_url, timeout=self.timeout)
+        except Exception as e:
+            logger.warning(f"SF3D WebSocket unavailable, falling back to polling: {e}")
+            ws.close()
+            return None
+        return ws
+
+    def _wait_on_websocket(self, ws: websocket.WebSocket, prompt_id: str, deadline: float) -> bool:
+        """Block until ComfyUI reports that a prompt has finished executing.
+
+        Args:
+            ws: Connected ComfyUI WebSocket
+            prompt_id: Prompt to wait for
+            deadline: time.time() value after which to give up
+
+        Returns:
+            True once the prompt finished, False on timeout or a dropped connection
+        """
+        try:
+            while True:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                ws.settimeout(remaining)
+
+                out = ws.recv()
+                if not isinstance(out, str):
+                    continue  # Binary preview frames
+
+                message = json.loads(out)
+                if message.get('type') == 'executing':
+                    data = message['data']
+                    if data.get('node') is None and data.get('prompt_id') == prompt_id:
+                        logger.info("SF3D execution completed")
+                        return True
+
+        except websocket.WebSocketTimeoutException:
+            return False
+        except Exception as e:
+            logger.warning(f"SF3D WebSocket error, falling back to polling: {e}")
+            return False
+
     async def generate_3d_asset(
         self,
         image_path: str,
@@ -272,22 +336,31 @@ class SF3DClient(ComfyUIClient):
         except Exception as e:
             raise Exception(f"Failed to build SF3D workflow: {e}")
 
-        # Queue the workflow for execution
+        # Subscribe before queueing so the completion message cannot be missed
+        ws = self._connect_websocket()
         try:
-            prompt_data = self.queue_prompt(workflow)
-            prompt_id = prompt_data["prompt_id"]
-            logger.info(f"SF3D workflow queued: {prompt_id[:8]}...")
-        except Exception as e:
-            raise Exception(f"Failed to queue SF3D workflow: {e}")
+            # Queue the workflow for execution
+            try:
+                prompt_data = self.queue_prompt(workflow)
+                prompt_id = prompt_data["prompt_id"]
+                logger.info(f"SF3D workflow queued: {prompt_id[:8]}...")
+            except Exception as e:
+                raise Exception(f"Failed to queue SF3D workflow: {e}")
 
-        # Wait for completion by polling history instead of WebSocket
-        max_wait_time = self.timeout
-        poll_interval = 2  # Check every 2 seconds
-        start_time = time.time()
+            max_wait_time = self.timeout
+            start_time = time.time()
+            deadline = start_time + max_wait_time
+
+            logger.info(f"Waiting for SF3D completion (max {max_wait_time}s)...")
 
-        logger.info(f"Waiting for SF3D completion (max {max_wait_time}s)...")
+            completed = ws is not None and self._wait_on_websocket(ws, prompt_id, deadline)
+        finally:
+            if ws is not None:
+                ws.close()
 
-        while time.time() - start_time < max_wait_time:
+        # Fall back to polling history if the WebSocket was unavailable or dropped
+        poll_interval = 2  # Check every 2 seconds
+        while not completed and time.time() < deadline:
             try:
                 history = self.get_history(prompt_id)
                 if prompt_id in history:
@@ -311,7 +384,8 @@ class SF3DClient(ComfyUIClient):
                 time.sleep(poll_interval)
 
         else:
-            raise Exception(f"SF3D execution timeout after {max_wait_time} seconds")
+            if not completed:
+                raise Exception(f"SF3D execution timeout after {max_wait_time} seconds")
 
         # Get final execution results
         try:
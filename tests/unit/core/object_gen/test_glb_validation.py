@@ -0,0 +1,75 @@
+# pylint: skip-file
+"""Test GLB validation through the JSON-chunk fast path."""
+
+import struct
+
+import pytest
+
+trimesh = pytest.importorskip("trimesh")
+
+from holodeck_core.object_gen.normalizers import GLBNormalizer, _read_glb_json
+
+
+@pytest.fixture
+def box_glb(tmp_path):
+    """Well-formed GLB of a unit box."""
+    path = tmp_path / "box.glb"
+    path.write_bytes(trimesh.creation.box().export(file_type="glb"))
+    return path
+
+
+def _bin_chunk_offset(data):
+    json_length = struct.unpack_from("<I", data, 12)[0]
+    return 20 + json_length
+
+
+@pytest.mark.unit
+class TestGLBFastPath:
+    """Test that the fast path only trusts well-formed files."""
+
+    def test_valid_file_uses_json_chunk(self, box_glb):
+        """Test that a well-formed GLB is read from its JSON chunk."""
+        gltf = _read_glb_json(box_glb)
+
+        assert gltf is not None
+        assert gltf["meshes"]
+
+    def test_fast_and_deep_agree_on_valid_file(self, box_glb):
+        """Test that fast validation reports the same vertex count as trimesh."""
+        normalizer = GLBNormalizer()
+
+        fast = normalizer.validate_glb(box_glb)
+        deep = normalizer.validate_glb(box_glb, deep=True)
+
+        assert fast["is_valid"] and deep["is_valid"]
+        assert fast["vertex_count"] == deep["vertex_count"] == 8
+
+    def test_truncated_file_is_rejected(self, box_glb, tmp_path):
+        """Test that a header length past the end of file skips the fast path."""
+        truncated = tmp_path / "truncated.glb"
+        truncated.write_bytes(box_glb.read_bytes()[:-40])
+
+        assert _read_glb_json(truncated) is None
+        assert not GLBNormalizer().validate_glb(truncated)["is_valid"]
+
+    def test_buffer_view_out_of_bounds_is_rejected(self, box_glb, tmp_path):
+        """Test that bufferViews reaching past the BIN chunk skip the fast path."""
+        data = bytearray(box_glb.read_bytes()[:-40])
+        # Make the header and BIN chunk lengths consistent with the shorter file
+        struct.pack_into("<I", data, 8, len(data))
+        bin_offset = _bin_chunk_offset(data)
+        bin_length = struct.unpack_from("<I", data, bin_offset)[0]
+        struct.pack_into("<I", data, bin_offset, bin_length - 40)
+        patched = tmp_path / "patched.glb"
+        patched.write_bytes(bytes(data))
+
+        assert _read_glb_json(patched) is None
+
+    def test_missing_bin_chunk_is_rejected(self, box_glb, tmp_path):
+        """Test that a GLB without its BIN chunk skips the fast path."""
+        data = bytearray(box_glb.read_bytes()[:_bin_chunk_offset(box_glb.read_bytes())])
+        struct.pack_into("<I", data, 8, len(data))
+        no_bin = tmp_path / "no_bin.glb"
+        no_bin.write_bytes(bytes(data))
+
+        assert _read_glb_json(no_bin) is None
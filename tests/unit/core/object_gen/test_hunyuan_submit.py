@@ -0,0 +1,76 @@
+# pylint: skip-file
+"""Test Hunyuan3DClient job submit retries and circuit breaker."""
+
+import pytest
+
+pytest.importorskip("tencentcloud")
+
+from tencentcloud.common.exception.tencent_cloud_sdk_exception import TencentCloudSDKException
+
+from holodeck_core.object_gen import hunyuan_3d_client as hunyuan_module
+from holodeck_core.object_gen.hunyuan_3d_client import Hunyuan3DClient
+
+
+class FakeSDKClient:
+    """Raises the queued errors in order, then returns a job."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def call(self, action, params):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return '{"Response": {"JobId": "job-1"}}'
+
+
+@pytest.fixture
+def hunyuan_client(monkeypatch):
+    """Client without credentials whose retries do not sleep."""
+    monkeypatch.setattr(hunyuan_module.time, "sleep", lambda seconds: None)
+    client = Hunyuan3DClient.__new__(Hunyuan3DClient)
+    client._breaker_open_until = 0.0
+    return client
+
+
+@pytest.mark.unit
+class TestHunyuanSubmitRetries:
+    """Test that only rate limiting is retried."""
+
+    def test_rate_limit_is_retried(self, hunyuan_client):
+        """Test that RequestLimitExceeded is retried until the submit succeeds."""
+        hunyuan_client.client = FakeSDKClient([TencentCloudSDKException("RequestLimitExceeded", "slow down")] * 2)
+
+        response = hunyuan_client._call_submit("task", {})
+
+        assert "job-1" in response
+        assert hunyuan_client.client.calls == 3
+
+    @pytest.mark.parametrize("code", ["InternalError", "ClientNetworkError", "ServerNetworkError"])
+    def test_other_errors_are_not_retried(self, hunyuan_client, code):
+        """Test that errors after which a job may exist are raised unchanged."""
+        hunyuan_client.client = FakeSDKClient([TencentCloudSDKException(code, "failed")])
+
+        with pytest.raises(TencentCloudSDKException) as excinfo:
+            hunyuan_client._call_submit("task", {})
+
+        assert excinfo.value.get_code() == code
+        assert hunyuan_client.client.calls == 1
+
+    def test_breaker_opens_after_exhausted_retries(self, hunyuan_client):
+        """Test that later submits fail fast once retries are used up."""
+        retries = hunyuan_module._SUBMIT_RETRIES
+        hunyuan_client.client = FakeSDKClient(
+            [TencentCloudSDKException("RequestLimitExceeded", "slow down")] * (retries + 1)
+        )
+
+        with pytest.raises(TencentCloudSDKException):
+            hunyuan_client._call_submit("task", {})
+        assert hunyuan_client.client.calls == retries + 1
+
+        with pytest.raises(TencentCloudSDKException) as excinfo:
+            hunyuan_client._call_submit("task", {})
+
+        assert excinfo.value.get_code() == "CircuitBreakerOpen"
+        assert hunyuan_client.client.calls == retries + 1
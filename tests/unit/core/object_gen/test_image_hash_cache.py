@@ -0,0 +1,68 @@
+# pylint: skip-file
+"""Test ImageHashCache manifest file handle lifecycle."""
+
+import shutil
+
+import pytest
+
+from holodeck_core.object_gen import cache as cache_module
+from holodeck_core.object_gen.cache import ImageHashCache
+
+
+@pytest.fixture
+def hash_cache(tmp_path):
+    """Cache with a source image and GLB to store."""
+    image_cache = ImageHashCache(str(tmp_path / "workspace"))
+    image = tmp_path / "card.png"
+    image.write_bytes(b"not really a png")
+    glb = tmp_path / "asset.glb"
+    glb.write_bytes(b"glTF")
+    yield image_cache, image, glb
+    image_cache.close()
+
+
+@pytest.mark.unit
+class TestImageHashCacheHandles:
+    """Test that manifest handles stay bounded and are released."""
+
+    def test_open_handles_are_capped(self, hash_cache):
+        """Test that many sessions never keep more than the cap open."""
+        image_cache, image, glb = hash_cache
+        for i in range(50):
+            image_cache.store_in_cache(str(image), str(glb), {}, f"session_{i}")
+            assert len(image_cache._fds) <= cache_module._MAX_OPEN_MANIFESTS
+
+    def test_evicted_handles_are_closed(self, hash_cache):
+        """Test that LRU eviction closes the dropped handle."""
+        image_cache, image, glb = hash_cache
+        image_cache.store_in_cache(str(image), str(glb), {}, "first")
+        first_fd = image_cache._fds[image_cache._get_session_cache_file("first")]
+
+        for i in range(cache_module._MAX_OPEN_MANIFESTS):
+            image_cache.store_in_cache(str(image), str(glb), {}, f"session_{i}")
+
+        assert first_fd.closed
+
+    def test_close_releases_all_handles(self, hash_cache):
+        """Test that close() closes every open manifest."""
+        image_cache, image, glb = hash_cache
+        image_cache.store_in_cache(str(image), str(glb), {}, "session")
+        handles = list(image_cache._fds.values())
+        assert handles
+
+        image_cache.close()
+
+        assert not image_cache._fds
+        assert all(fd.closed for fd in handles)
+
+    def test_reuse_after_session_removed(self, hash_cache):
+        """Test that the cache still works after close() and session rmtree."""
+        image_cache, image, glb = hash_cache
+        image_cache.store_in_cache(str(image), str(glb), {"n": 1}, "session")
+        image_cache.close()
+
+        shutil.rmtree(image_cache._get_session_cache_dir("session"))
+
+        result = image_cache.lookup_cache(str(image), "session")
+        assert result is not None
+        assert result[1] == {"n": 1}
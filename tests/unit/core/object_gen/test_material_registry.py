@@ -0,0 +1,146 @@
+# pylint: skip-file
+"""Test MaterialManager texture storage and registry persistence."""
+
+import os
+import time
+
+import pytest
+from PIL import Image
+
+from holodeck_core.object_gen import material_manager as material_module
+from holodeck_core.object_gen.material_manager import MaterialManager, MaterialQuality, TextureType
+
+
+class FakeWorkspace:
+    """Minimal workspace manager exposing the workspace root."""
+
+    def __init__(self, root):
+        self.workspace_root = root
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    return FakeWorkspace(tmp_path)
+
+
+@pytest.fixture
+def texture(tmp_path):
+    """Small RGB texture on disk."""
+    path = tmp_path / "source.png"
+    Image.new("RGB", (64, 64), (10, 20, 30)).save(path)
+    return path
+
+
+def _write_registry(workspace, name, human_readable):
+    manager = MaterialManager(workspace, human_readable_registry=human_readable)
+    manager.create_material(name, MaterialQuality.HIGH)
+    return manager
+
+
+@pytest.mark.unit
+class TestTextureContentHash:
+    """Test that processed textures are named by content."""
+
+    def test_identical_content_shares_one_file(self, workspace, texture, tmp_path):
+        """Test that the same image added twice is stored once."""
+        manager = MaterialManager(workspace)
+        copy = tmp_path / "copy.png"
+        copy.write_bytes(texture.read_bytes())
+        first = manager.create_material("first")
+        second = manager.create_material("second")
+
+        manager.add_texture(first, texture, TextureType.ALBEDO)
+        manager.add_texture(second, copy, TextureType.ALBEDO)
+
+        assert (manager.materials[first].textures[TextureType.ALBEDO].path
+                == manager.materials[second].textures[TextureType.ALBEDO].path)
+
+    def test_different_content_gets_different_files(self, workspace, texture, tmp_path):
+        """Test that different images do not collide."""
+        manager = MaterialManager(workspace)
+        other = tmp_path / "other.png"
+        Image.new("RGB", (64, 64), (200, 100, 0)).save(other)
+        material_id = manager.create_material("material")
+
+        manager.add_texture(material_id, texture, TextureType.ALBEDO)
+        manager.add_texture(material_id, other, TextureType.ROUGHNESS)
+
+        textures = manager.materials[material_id].textures
+        assert textures[TextureType.ALBEDO].path != textures[TextureType.ROUGHNESS].path
+
+    def test_shared_file_survives_until_last_owner_deleted(self, workspace, texture):
+        """Test that deleting one material keeps textures another still uses."""
+        manager = MaterialManager(workspace)
+        first = manager.create_material("first")
+        second = manager.create_material("second")
+        manager.add_texture(first, texture, TextureType.ALBEDO)
+        manager.add_texture(second, texture, TextureType.ALBEDO)
+        shared = manager.materials[first].textures[TextureType.ALBEDO].path
+
+        manager.delete_material(first)
+        assert shared.exists()
+
+        manager.delete_material(second)
+        assert not shared.exists()
+
+
+@pytest.mark.unit
+class TestMaterialRegistry:
+    """Test registry round trips and format fallback."""
+
+    def test_round_trip(self, workspace, texture):
+        """Test that a reloaded manager sees the same materials."""
+        manager = MaterialManager(workspace)
+        material_id = manager.create_material("material", MaterialQuality.HIGH)
+        manager.add_texture(material_id, texture, TextureType.AO)
+
+        reloaded = MaterialManager(workspace)
+
+        assert reloaded.materials[material_id] == manager.materials[material_id]
+
+    def test_newest_registry_wins(self, workspace):
+        """Test that the most recently written format is loaded."""
+        pytest.importorskip("msgpack")
+        _write_registry(workspace, "old", human_readable=True)
+        time.sleep(0.02)
+        _write_registry(workspace, "new", human_readable=False)
+
+        names = {material.name for material in MaterialManager(workspace).materials.values()}
+
+        assert "new" in names
+
+    def test_falls_back_to_json_without_msgpack(self, workspace, monkeypatch):
+        """Test that an unreadable newer msgpack registry falls back to JSON."""
+        pytest.importorskip("msgpack")
+        _write_registry(workspace, "json_material", human_readable=True)
+        time.sleep(0.02)
+        binary = _write_registry(workspace, "binary_material", human_readable=False)
+        registry_json = binary.materials_dir / "registry.json"
+        registry_mpk = binary.materials_dir / "registry.mpk"
+        assert os.path.getmtime(registry_mpk) >= os.path.getmtime(registry_json)
+
+        monkeypatch.setattr(material_module, "MSGPACK_AVAILABLE", False)
+        names = {material.name for material in MaterialManager(workspace).materials.values()}
+
+        assert names == {"json_material"}
+
+    def test_msgpack_only_registry_raises_without_msgpack(self, workspace, monkeypatch):
+        """Test that a msgpack-only registry is not silently treated as empty."""
+        pytest.importorskip("msgpack")
+        binary = _write_registry(workspace, "binary_material", human_readable=False)
+        (binary.materials_dir / "registry.json").unlink(missing_ok=True)
+
+        monkeypatch.setattr(material_module, "MSGPACK_AVAILABLE", False)
+        with pytest.raises(RuntimeError):
+            MaterialManager(workspace)
+
+    def test_corrupt_registry_falls_back(self, workspace):
+        """Test that a corrupt newest registry falls back to the older one."""
+        pytest.importorskip("msgpack")
+        manager = _write_registry(workspace, "json_material", human_readable=True)
+        time.sleep(0.02)
+        (manager.materials_dir / "registry.mpk").write_bytes(b"\xc1 not msgpack")
+
+        names = {material.name for material in MaterialManager(workspace).materials.values()}
+
+        assert names == {"json_material"}
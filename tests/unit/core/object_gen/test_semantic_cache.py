@@ -0,0 +1,107 @@
+# pylint: skip-file
+"""Test SemanticCache matching and thread safety."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from holodeck_core.object_gen.enhanced_llm_naming_service import NamingResult, SemanticCache
+
+
+def _result(name):
+    return NamingResult(
+        original_name="lamp",
+        generated_name=name,
+        style="现代",
+        material="金属",
+        confidence=0.8,
+        analysis_used=False,
+        processing_time=0.0
+    )
+
+
+def _keyword_embedding(text):
+    """Texts mentioning "lamp" share one direction, everything else another."""
+    vector = np.zeros(4)
+    vector[0 if "lamp" in text else 1] = 1.0
+    return vector
+
+
+@pytest.mark.unit
+class TestSemanticCache:
+    """Test lookups by embedding similarity."""
+
+    def test_similar_request_hits(self):
+        """Test that a paraphrased request returns the stored result."""
+        cache = SemanticCache(embed_fn=_keyword_embedding)
+        cache.set("a tall brass floor lamp", "lamp", _result("黄铜落地灯"))
+
+        hit = cache.get("brass lamp standing on the floor", "lamp")
+
+        assert hit is not None
+        assert hit.generated_name == "黄铜落地灯"
+
+    def test_dissimilar_request_misses(self):
+        """Test that an unrelated request does not match."""
+        cache = SemanticCache(embed_fn=_keyword_embedding)
+        cache.set("a tall brass floor lamp", "lamp", _result("黄铜落地灯"))
+
+        assert cache.get("a wooden dining chair", "chair") is None
+
+    def test_short_requests_are_not_matched(self):
+        """Test that requests below min_text_length bypass the cache."""
+        cache = SemanticCache(embed_fn=_keyword_embedding, min_text_length=64)
+        cache.set("brass lamp", "lamp", _result("黄铜灯"))
+
+        assert len(cache) == 0
+        assert cache.get("brass lamp", "lamp") is None
+
+    def test_expired_entries_miss(self):
+        """Test that entries past their TTL are ignored."""
+        cache = SemanticCache(embed_fn=_keyword_embedding, ttl=-1)
+        cache.set("a tall brass floor lamp", "lamp", _result("黄铜落地灯"))
+
+        assert cache.get("a tall brass floor lamp", "lamp") is None
+
+    def test_ring_buffer_keeps_max_entries(self):
+        """Test that the cache overwrites the oldest entries past max_entries."""
+        cache = SemanticCache(embed_fn=_keyword_embedding, max_entries=3)
+        for i in range(10):
+            cache.set(f"description number {i}", "chair", _result(f"椅子{i}"))
+
+        assert len(cache) == 3
+
+    def test_concurrent_get_and_set(self):
+        """Test that lookups never see a half-grown matrix while another thread stores."""
+        rng = np.random.default_rng(0)
+        rng_lock = threading.Lock()
+
+        def embed(text):
+            if "query" in text:
+                return np.ones(32)
+            with rng_lock:
+                return rng.standard_normal(32)
+
+        cache = SemanticCache(embed_fn=embed, max_entries=5000)
+        errors = []
+
+        def setter():
+            for i in range(2000):
+                cache.set(f"description number {i}", "chair", _result("椅子"))
+
+        def getter():
+            try:
+                for _ in range(2000):
+                    cache.get("query description text", "chair")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=setter)] + [threading.Thread(target=getter) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(cache) == 2000